@@ -1,12 +1,31 @@
 """PR health analyzer for tracking pull request lifecycle and flow efficiency."""
 
-from collections import defaultdict
+import io
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from functools import cached_property
+from operator import attrgetter
+from typing import List, Optional, cast
 
-from ..models import PullRequest, PRState
+import numpy as np
+import pandas as pd
+
+from ..models import PRState, PullRequest
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_US_PER_DAY = 86_400_000_000
+
+# Days without activity before a PR counts as stale / abandoned
+STALE_DAYS = 7
+ABANDONED_DAYS = 30
+
+# Lines changed at which a PR counts as medium; above LARGE_PR_LINES it is large
+MEDIUM_PR_LINES = 100
+LARGE_PR_LINES = 500
 
 
 class PRHealthStatus(Enum):
@@ -23,9 +42,39 @@ class PRSize(Enum):
     LARGE = "large"        # > 500 lines
 
 
+# Sort keys for the stale (most inactive first) and abandoned (oldest first) lists
+_BY_INACTIVITY = attrgetter("days_since_activity")
+_BY_AGE = attrgetter("age_days")
+
+# Category for each np.digitize bucket index
+_STATUSES = (PRHealthStatus.ACTIVE, PRHealthStatus.STALE, PRHealthStatus.ABANDONED)
+_SIZES = (PRSize.SMALL, PRSize.MEDIUM, PRSize.LARGE)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch (naive treated as UTC)."""
+    epoch = _EPOCH if value.tzinfo is not None else _EPOCH_NAIVE
+    return (value - epoch) // _ONE_MICROSECOND
+
+
+def _to_epoch_us_array(values: List[datetime]) -> np.ndarray:
+    """Convert datetimes to int64 epoch microseconds in one call (naive treated as UTC)."""
+    timestamps = pd.to_datetime(values, utc=True).tz_convert(None)
+    epoch_us = timestamps.to_numpy().astype("datetime64[us]").view(np.int64)
+    return cast(np.ndarray, np.asarray(epoch_us, dtype=np.int64))
+
+
 @dataclass
 class PRHealthMetrics:
     """Health metrics for a single PR."""
+    # One instance per open PR; slots avoid a per-instance __dict__ (the
+    # fields have no defaults, so this works without dataclass(slots=True))
+    __slots__ = (
+        "pr_number", "title", "author", "status", "size", "age_days",
+        "days_since_activity", "created_at", "updated_at", "additions",
+        "deletions", "commits_count",
+    )
+    
     pr_number: int
     title: str
     author: str
@@ -43,6 +92,23 @@ class PRHealthMetrics:
     def total_lines_changed(self) -> int:
         """Total lines changed in the PR."""
         return self.additions + self.deletions
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "pr_number": self.pr_number,
+            "title": self.title,
+            "author": self.author,
+            "status": self.status.value,
+            "size": self.size.value,
+            "age_days": self.age_days,
+            "days_since_activity": self.days_since_activity,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "additions": self.additions,
+            "deletions": self.deletions,
+            "commits_count": self.commits_count,
+        }
 
 
 @dataclass
@@ -60,7 +126,8 @@ class PRHealthReport:
     medium_count: int = 0
     large_count: int = 0
     
-    # Detailed lists
+    # Detailed lists (analyze() orders stale PRs most inactive first and
+    # abandoned PRs oldest first)
     active_prs: List[PRHealthMetrics] = field(default_factory=list)
     stale_prs: List[PRHealthMetrics] = field(default_factory=list)
     abandoned_prs: List[PRHealthMetrics] = field(default_factory=list)
@@ -76,88 +143,145 @@ class PRHealthReport:
     # Recommendations
     recommendations: List[str] = field(default_factory=list)
     
+    # Set by PRHealthAnalyzer once stale/abandoned PRs are in report order
+    _prs_sorted: bool = field(default=False, init=False, repr=False, compare=False)
+    
     def get_summary(self) -> str:
         """Get a brief summary of PR health."""
-        lines = []
-        lines.append(f"Total Open PRs: {self.total_open_prs}")
-        lines.append(f"  Active: {self.active_count} ({self.active_count/self.total_open_prs*100:.0f}%)")
-        lines.append(f"  Stale: {self.stale_count} ({self.stale_count/self.total_open_prs*100:.0f}%)")
-        lines.append(f"  Abandoned: {self.abandoned_count} ({self.abandoned_count/self.total_open_prs*100:.0f}%)")
+        return self.summary
+    
+    def get_detailed_report(self) -> str:
+        """Get a detailed PR health report."""
+        return self.detailed_report
+    
+    def to_dict(self) -> dict:
+        """
+        Convert to dictionary for JSON serialization.
+        
+        The dictionary is built on first use and the same object is returned
+        afterwards, so callers should treat it as read-only.
+        """
+        return self._payload
+    
+    @cached_property
+    def _payload(self) -> dict:
+        """Serialized form of the report, built once."""
+        return {
+            "total_open_prs": self.total_open_prs,
+            "active_count": self.active_count,
+            "stale_count": self.stale_count,
+            "abandoned_count": self.abandoned_count,
+            "small_count": self.small_count,
+            "medium_count": self.medium_count,
+            "large_count": self.large_count,
+            "median_age_days": self.median_age_days,
+            "oldest_pr_age_days": self.oldest_pr_age_days,
+            "total_stale_days": self.total_stale_days,
+            "total_abandoned_days": self.total_abandoned_days,
+            "active_prs": [pr.to_dict() for pr in self.active_prs],
+            "stale_prs": [pr.to_dict() for pr in self.stale_prs],
+            "abandoned_prs": [pr.to_dict() for pr in self.abandoned_prs],
+            "recommendations": list(self.recommendations),
+        }
+    
+    # The rendered text is cached on first access; reports are complete once
+    # PRHealthAnalyzer.analyze() returns them
+    @cached_property
+    def summary(self) -> str:
+        """Brief summary of PR health."""
+        total = self.total_open_prs
+        lines = [
+            f"Total Open PRs: {total}",
+            f"  Active: {self.active_count} ({self.active_count / total:.0%})",
+            f"  Stale: {self.stale_count} ({self.stale_count / total:.0%})",
+            f"  Abandoned: {self.abandoned_count} ({self.abandoned_count / total:.0%})",
+        ]
         
         if self.stale_count > 0:
             lines.append(f"\n⚠️  {self.stale_count} PRs need attention (stale for 7-30 days)")
         
         if self.abandoned_count > 0:
-            lines.append(f"❌ {self.abandoned_count} PRs should be closed or revived (abandoned 30+ days)")
+            lines.append(
+                f"❌ {self.abandoned_count} PRs should be closed or revived (abandoned 30+ days)"
+            )
             
         return "\n".join(lines)
     
-    def get_detailed_report(self) -> str:
-        """Get a detailed PR health report."""
-        lines = []
-        lines.append("=" * 60)
-        lines.append("PR HEALTH REPORT")
-        lines.append("=" * 60)
-        lines.append("")
+    @cached_property
+    def detailed_report(self) -> str:
+        """Detailed PR health report."""
+        out = io.StringIO()
+        write = out.write
+        write("=" * 60 + "\n")
+        write("PR HEALTH REPORT\n")
+        write("=" * 60 + "\n")
+        write("\n")
         
         # Summary
-        lines.append("SUMMARY")
-        lines.append("-" * 20)
-        lines.append(f"Total Open PRs: {self.total_open_prs}")
-        lines.append(f"  Active: {self.active_count}")
-        lines.append(f"  Stale: {self.stale_count}")
-        lines.append(f"  Abandoned: {self.abandoned_count}")
-        lines.append("")
+        write("SUMMARY\n")
+        write("-" * 20 + "\n")
+        write(f"Total Open PRs: {self.total_open_prs}\n")
+        write(f"  Active: {self.active_count}\n")
+        write(f"  Stale: {self.stale_count}\n")
+        write(f"  Abandoned: {self.abandoned_count}\n")
+        write("\n")
         
         # Size distribution
-        lines.append("SIZE DISTRIBUTION")
-        lines.append("-" * 20)
-        lines.append(f"  Small (<100 lines): {self.small_count}")
-        lines.append(f"  Medium (100-500 lines): {self.medium_count}")
-        lines.append(f"  Large (>500 lines): {self.large_count}")
-        lines.append("")
+        write("SIZE DISTRIBUTION\n")
+        write("-" * 20 + "\n")
+        write(f"  Small (<100 lines): {self.small_count}\n")
+        write(f"  Medium (100-500 lines): {self.medium_count}\n")
+        write(f"  Large (>500 lines): {self.large_count}\n")
+        write("\n")
         
         # Age statistics
         if self.median_age_days is not None:
-            lines.append("AGE STATISTICS")
-            lines.append("-" * 20)
-            lines.append(f"  Median age: {self.median_age_days:.0f} days")
-            lines.append(f"  Oldest PR: {self.oldest_pr_age_days} days")
-            lines.append("")
+            write("AGE STATISTICS\n")
+            write("-" * 20 + "\n")
+            write(f"  Median age: {self.median_age_days:.0f} days\n")
+            write(f"  Oldest PR: {self.oldest_pr_age_days} days\n")
+            write("\n")
         
         # Stale PRs
         if self.stale_prs:
-            lines.append("STALE PRS (need attention)")
-            lines.append("-" * 20)
-            for pr in sorted(self.stale_prs, key=lambda x: x.days_since_activity, reverse=True)[:10]:
-                lines.append(f"  • PR #{pr.pr_number}: {pr.title[:50]}...")
-                lines.append(f"    Author: {pr.author}, Size: {pr.size.value}, "
-                           f"Inactive: {pr.days_since_activity} days")
+            write("STALE PRS (need attention)\n")
+            write("-" * 20 + "\n")
+            stale_prs = self.stale_prs
+            if not self._prs_sorted:
+                stale_prs = sorted(stale_prs, key=_BY_INACTIVITY, reverse=True)
+            for pr in stale_prs[:10]:
+                write(f"  • PR #{pr.pr_number}: {pr.title[:50]}...\n")
+                write(f"    Author: {pr.author}, Size: {pr.size.value}, "
+                      f"Inactive: {pr.days_since_activity} days\n")
             if len(self.stale_prs) > 10:
-                lines.append(f"  ... and {len(self.stale_prs) - 10} more")
-            lines.append("")
+                write(f"  ... and {len(self.stale_prs) - 10} more\n")
+            write("\n")
         
         # Abandoned PRs
         if self.abandoned_prs:
-            lines.append("ABANDONED PRS (close or revive)")
-            lines.append("-" * 20)
-            for pr in sorted(self.abandoned_prs, key=lambda x: x.age_days, reverse=True)[:10]:
-                lines.append(f"  • PR #{pr.pr_number}: {pr.title[:50]}...")
-                lines.append(f"    Author: {pr.author}, Age: {pr.age_days} days, "
-                           f"Size: {pr.size.value}")
+            write("ABANDONED PRS (close or revive)\n")
+            write("-" * 20 + "\n")
+            abandoned_prs = self.abandoned_prs
+            if not self._prs_sorted:
+                abandoned_prs = sorted(abandoned_prs, key=_BY_AGE, reverse=True)
+            for pr in abandoned_prs[:10]:
+                write(f"  • PR #{pr.pr_number}: {pr.title[:50]}...\n")
+                write(f"    Author: {pr.author}, Age: {pr.age_days} days, "
+                      f"Size: {pr.size.value}\n")
             if len(self.abandoned_prs) > 10:
-                lines.append(f"  ... and {len(self.abandoned_prs) - 10} more")
-            lines.append("")
+                write(f"  ... and {len(self.abandoned_prs) - 10} more\n")
+            write("\n")
         
         # Recommendations
         if self.recommendations:
-            lines.append("RECOMMENDATIONS")
-            lines.append("-" * 20)
+            write("RECOMMENDATIONS\n")
+            write("-" * 20 + "\n")
             for i, rec in enumerate(self.recommendations, 1):
-                lines.append(f"{i}. {rec}")
-            lines.append("")
+                write(f"{i}. {rec}\n")
+            write("\n")
             
-        return "\n".join(lines)
+        # Lines are newline-separated, with no newline after the last one
+        return out.getvalue()[:-1]
 
 
 class PRHealthAnalyzer:
@@ -172,6 +296,16 @@ class PRHealthAnalyzer:
         """
         self.reference_time = reference_time or datetime.now(timezone.utc)
     
+    @property
+    def reference_time(self) -> datetime:
+        """Time used as "now" when measuring PR age and inactivity."""
+        return self._reference_time
+    
+    @reference_time.setter
+    def reference_time(self, value: datetime) -> None:
+        self._reference_time = value
+        self._reference_us = _to_epoch_us(value)
+    
     def analyze(self, pull_requests: List[PullRequest]) -> PRHealthReport:
         """
         Analyze PR health for a list of pull requests.
@@ -182,97 +316,91 @@ class PRHealthAnalyzer:
         Returns:
             PRHealthReport with categorized PRs and recommendations
         """
-        report = PRHealthReport()
-        
-        # Filter to open PRs only
-        open_prs = [pr for pr in pull_requests if pr.state == PRState.OPEN]
-        report.total_open_prs = len(open_prs)
-        
+        # Filter to open PRs only; with none there is nothing to categorize,
+        # so return an empty report before building any arrays
+        open_state = PRState.OPEN  # bound once; enum members compare by identity
+        open_prs = [pr for pr in pull_requests if pr.state is open_state]
         if not open_prs:
-            return report
+            return PRHealthReport()
         
-        # Analyze each PR
-        pr_metrics = []
-        for pr in open_prs:
-            metrics = self._analyze_single_pr(pr)
-            pr_metrics.append(metrics)
-            
-            # Categorize by status
-            if metrics.status == PRHealthStatus.ACTIVE:
-                report.active_prs.append(metrics)
-                report.active_count += 1
-            elif metrics.status == PRHealthStatus.STALE:
-                report.stale_prs.append(metrics)
-                report.stale_count += 1
-                report.total_stale_days += metrics.days_since_activity
-            else:  # ABANDONED
-                report.abandoned_prs.append(metrics)
-                report.abandoned_count += 1
-                report.total_abandoned_days += metrics.days_since_activity
-            
-            # Categorize by size
-            if metrics.size == PRSize.SMALL:
-                report.small_count += 1
-            elif metrics.size == PRSize.MEDIUM:
-                report.medium_count += 1
-            else:  # LARGE
-                report.large_count += 1
+        report = PRHealthReport(total_open_prs=len(open_prs))
         
-        # Calculate age statistics
-        ages = [m.age_days for m in pr_metrics]
-        if ages:
-            ages.sort()
-            report.median_age_days = ages[len(ages) // 2]
-            report.oldest_pr_age_days = max(ages)
+        # Categorize all PRs at once from column arrays of their dates and sizes
+        count = len(open_prs)
+        reference_us = self._reference_us
+        created_us = _to_epoch_us_array([pr.created_at for pr in open_prs])
+        activity_us = _to_epoch_us_array([pr.updated_at or pr.created_at for pr in open_prs])
+        total_lines = np.fromiter(
+            (pr.additions + pr.deletions for pr in open_prs), dtype=np.int64, count=count
+        )
         
-        # Generate recommendations
-        self._generate_recommendations(report)
+        age_days = (reference_us - created_us) // _US_PER_DAY
+        inactive_days = (reference_us - activity_us) // _US_PER_DAY
+        status_idx = np.digitize(inactive_days, [STALE_DAYS, ABANDONED_DAYS])
+        size_idx = np.digitize(total_lines, [MEDIUM_PR_LINES, LARGE_PR_LINES + 1])
         
-        return report
-    
-    def _analyze_single_pr(self, pr: PullRequest) -> PRHealthMetrics:
-        """Analyze health metrics for a single PR."""
-        # Calculate age and activity
-        age = self.reference_time - pr.created_at
-        age_days = age.days
+        # Counts and waiting days per category in one pass each
+        report.active_count, report.stale_count, report.abandoned_count = (
+            np.bincount(status_idx, minlength=3).tolist()
+        )
+        report.small_count, report.medium_count, report.large_count = (
+            np.bincount(size_idx, minlength=3).tolist()
+        )
+        inactive_totals = np.bincount(status_idx, weights=inactive_days, minlength=3)
+        report.total_stale_days = int(inactive_totals[1])
+        report.total_abandoned_days = int(inactive_totals[2])
         
-        last_activity = pr.updated_at or pr.created_at
-        days_since_activity = (self.reference_time - last_activity).days
+        buckets = (report.active_prs, report.stale_prs, report.abandoned_prs)
+        for pr, status, size, age, inactive in zip(
+            open_prs, status_idx.tolist(), size_idx.tolist(),
+            age_days.tolist(), inactive_days.tolist()
+        ):
+            metrics = PRHealthMetrics(
+                pr_number=pr.number,
+                title=pr.title,
+                author=pr.author,
+                status=_STATUSES[status],
+                size=_SIZES[size],
+                age_days=age,
+                days_since_activity=inactive,
+                created_at=pr.created_at,
+                updated_at=pr.updated_at,
+                additions=pr.additions,
+                deletions=pr.deletions,
+                commits_count=len(pr.commits)
+            )
+            buckets[status].append(metrics)
         
-        # Determine status
-        if days_since_activity < 7:
-            status = PRHealthStatus.ACTIVE
-        elif days_since_activity < 30:
-            status = PRHealthStatus.STALE
-        else:
-            status = PRHealthStatus.ABANDONED
+        # Calculate age statistics; the median is the upper middle value, found
+        # by partial selection rather than a full sort
+        middle = count // 2
+        report.median_age_days = int(np.partition(age_days, middle)[middle])
+        report.oldest_pr_age_days = int(age_days.max())
         
-        # Determine size
-        total_lines = pr.additions + pr.deletions
-        if total_lines < 100:
-            size = PRSize.SMALL
-        elif total_lines <= 500:
-            size = PRSize.MEDIUM
-        else:
-            size = PRSize.LARGE
+        # Generate recommendations
+        large_inactive = int(np.count_nonzero((status_idx > 0) & (size_idx == 2)))
+        self._generate_recommendations(report, large_inactive)
         
-        return PRHealthMetrics(
-            pr_number=pr.number,
-            title=pr.title,
-            author=pr.author,
-            status=status,
-            size=size,
-            age_days=age_days,
-            days_since_activity=days_since_activity,
-            created_at=pr.created_at,
-            updated_at=pr.updated_at,
-            additions=pr.additions,
-            deletions=pr.deletions,
-            commits_count=len(pr.commits)
-        )
+        # Order the lists as the detailed report shows them, once (after the
+        # recommendations, whose author tie-break follows analysis order)
+        report.stale_prs.sort(key=_BY_INACTIVITY, reverse=True)
+        report.abandoned_prs.sort(key=_BY_AGE, reverse=True)
+        report._prs_sorted = True
+        
+        return report
     
-    def _generate_recommendations(self, report: PRHealthReport) -> None:
-        """Generate actionable recommendations based on PR health."""
+    def _generate_recommendations(
+        self,
+        report: PRHealthReport,
+        large_inactive_count: int
+    ) -> None:
+        """
+        Generate actionable recommendations based on PR health.
+        
+        Args:
+            report: Report with counts and categorized PRs filled in
+            large_inactive_count: Number of large PRs that are stale or abandoned
+        """
         # High abandoned count
         if report.abandoned_count > 5:
             report.recommendations.append(
@@ -280,16 +408,14 @@ class PRHealthAnalyzer:
             )
         
         # High stale percentage
-        if report.stale_count > 0 and report.stale_count / report.total_open_prs > 0.3:
+        stale_ratio = report.stale_count / report.total_open_prs
+        if stale_ratio > 0.3:
             report.recommendations.append(
-                f"{report.stale_count/report.total_open_prs:.0%} of PRs are stale - "
-                "schedule regular PR review sessions"
+                f"{stale_ratio:.0%} of PRs are stale - schedule regular PR review sessions"
             )
         
         # Large PRs
-        large_stale = [pr for pr in report.stale_prs if pr.size == PRSize.LARGE]
-        large_abandoned = [pr for pr in report.abandoned_prs if pr.size == PRSize.LARGE]
-        if len(large_stale) + len(large_abandoned) > 3:
+        if large_inactive_count > 3:
             report.recommendations.append(
                 "Break down large PRs into smaller chunks for easier review"
             )
@@ -302,14 +428,13 @@ class PRHealthAnalyzer:
             )
         
         # Author concentration
-        stale_authors = defaultdict(int)
-        for pr in report.stale_prs + report.abandoned_prs:
-            stale_authors[pr.author] += 1
+        stale_authors = Counter(pr.author for pr in report.stale_prs)
+        stale_authors.update(pr.author for pr in report.abandoned_prs)
         
         if stale_authors:
-            top_author = max(stale_authors.items(), key=lambda x: x[1])
-            if top_author[1] > 3:
+            top_author, top_count = stale_authors.most_common(1)[0]
+            if top_count > 3:
                 report.recommendations.append(
-                    f"{top_author[0]} has {top_author[1]} stale/abandoned PRs - "
+                    f"{top_author} has {top_count} stale/abandoned PRs - "
                     "check if they need help"
                 )
\ No newline at end of file
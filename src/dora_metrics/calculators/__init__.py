@@ -1,5 +1,5 @@
 """Calculators for DORA metrics."""
 
-from .metrics import DORAMetrics, MetricsCalculator, MetricsConfig, Period
+from .metrics import DORAMetrics, MetricsCalculator, MetricsConfig, MetricsResultTable, Period
 
-__all__ = ["DORAMetrics", "MetricsCalculator", "MetricsConfig", "Period"]
\ No newline at end of file
+__all__ = ["DORAMetrics", "MetricsCalculator", "MetricsConfig", "MetricsResultTable", "Period"]
\ No newline at end of file
@@ -1,20 +1,40 @@
 """DORA metrics calculator with flexible calculation methods."""
 
-import json
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta, timezone, tzinfo
 from enum import Enum
-from typing import Dict, List, Optional, Tuple, Union
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
+import orjson
+import pandas as pd
 
 from ..logging import get_logger
 from ..models import Commit, Deployment, PullRequest
-from .quality import DataQualityValidator
 
 logger = get_logger(__name__)
 
+# Minimum number of reporting periods before calculate() uses a thread pool
+_PARALLEL_MIN_PERIODS = 32
+
+
+class DeploymentRecord(NamedTuple):
+    """A GitHub or manual deployment joined to its commit."""
+    time: datetime
+    commit: Commit
+    deployment: Optional[Deployment]  # None for manual deployments
+    failed: bool
+
+
+# Reads the failure flag of each record at C level (e.g. sum(map(_record_failed, records)))
+_record_failed = attrgetter("failed")
+
+# Deployments in a data window, keyed by window start (within one period)
+DeploymentWindows = Dict[datetime, List[DeploymentRecord]]
+
 
 class Period(Enum):
     """Time period for metric aggregation."""
@@ -28,13 +48,67 @@ class Period(Enum):
     ROLLING_90_DAYS = "rolling_90_days"
 
 
+def _next_day(current: datetime) -> datetime:
+    """Start of the next day."""
+    return current + timedelta(days=1)
+
+
+def _next_week(current: datetime) -> datetime:
+    """Start of the next week (weeks start on Monday)."""
+    return current + timedelta(days=7 - current.weekday())
+
+
+def _next_month(current: datetime) -> datetime:
+    """First day of the next month."""
+    if current.month == 12:
+        return current.replace(year=current.year + 1, month=1, day=1)
+    return current.replace(month=current.month + 1, day=1)
+
+
+def _next_quarter(current: datetime) -> datetime:
+    """First day of the next calendar quarter."""
+    current_quarter = (current.month - 1) // 3
+    if current_quarter == 3:  # Q4
+        return current.replace(year=current.year + 1, month=1, day=1)
+    return current.replace(month=(current_quarter + 1) * 3 + 1, day=1)
+
+
+def _next_year(current: datetime) -> datetime:
+    """First day of the next year."""
+    return current.replace(year=current.year + 1, month=1, day=1)
+
+
+# Start of the following period for each calendar reporting period. Plain
+# datetime arithmetic keeps the wall-clock time of day and handles DST gaps and
+# mixed time zones.
+_PERIOD_STEPS: Dict[Period, Callable[[datetime], datetime]] = {
+    Period.DAILY: _next_day,
+    Period.WEEKLY: _next_week,
+    Period.MONTHLY: _next_month,
+    Period.QUARTERLY: _next_quarter,
+    Period.YEARLY: _next_year,
+}
+
+_US_PER_HOUR = 3_600_000_000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Calculated statistics are NumPy scalars, which orjson only accepts when asked
+_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+# Summary statistics reported for lead time and MTTR, in serialization order
+_STATISTIC_KEYS = ("p50", "p90", "p95", "mean", "std_dev", "min", "max")
+
+
 class CalculationMethod(Enum):
     """Method for calculating metrics."""
     PERIOD_BASED = "period_based"  # Only data within the period
     ROLLING_WINDOW = "rolling_window"  # Look back N days from period end
 
 
-@dataclass
+@dataclass(frozen=True)
 class MetricConfig:
     """Configuration for how to calculate a specific metric."""
     period: Period
@@ -52,9 +126,12 @@ class MetricConfig:
             return 0
 
 
-@dataclass
+@dataclass(frozen=True)
 class MetricsConfig:
-    """Configuration for all DORA metrics calculations."""
+    """Configuration for all DORA metrics calculations.
+    
+    Configs are immutable, so the preset constructors return shared instances.
+    """
     lead_time: MetricConfig = field(default_factory=lambda: MetricConfig(Period.WEEKLY))
     deployment_frequency: MetricConfig = field(default_factory=lambda: MetricConfig(Period.DAILY))
     change_failure_rate: MetricConfig = field(default_factory=lambda: MetricConfig(Period.MONTHLY))
@@ -64,6 +141,7 @@ class MetricsConfig:
     reporting_period: Period = Period.WEEKLY
     
     @classmethod
+    @lru_cache(maxsize=None)
     def daily_all(cls) -> "MetricsConfig":
         """All metrics calculated daily."""
         return cls(
@@ -75,6 +153,7 @@ class MetricsConfig:
         )
         
     @classmethod
+    @lru_cache(maxsize=None)
     def recommended(cls) -> "MetricsConfig":
         """Recommended configuration for most teams."""
         return cls(
@@ -86,6 +165,7 @@ class MetricsConfig:
         )
         
     @classmethod
+    @lru_cache(maxsize=None)
     def quarterly_view(cls) -> "MetricsConfig":
         """Configuration for quarterly reporting."""
         return cls(
@@ -97,9 +177,9 @@ class MetricsConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class DORAMetrics:
-    """Container for DORA metrics results."""
+    """Container for DORA metrics results (immutable once calculated)."""
     lead_time_for_changes: Optional[float]  # Hours (median)
     deployment_frequency: Optional[float]  # Deployments per day
     change_failure_rate: Optional[float]  # Ratio (0.0 to 1.0)
@@ -136,76 +216,171 @@ class DORAMetrics:
     # Configuration used
     config: Optional[MetricsConfig] = None
     
+    # Serialized key -> attribute name, per section of to_dict()
+    _METRIC_FIELDS = (
+        ("lead_time_for_changes_hours", "lead_time_for_changes"),
+        ("deployment_frequency_per_day", "deployment_frequency"),
+        ("change_failure_rate_percent", "change_failure_rate"),
+        ("mean_time_to_restore_hours", "mean_time_to_restore"),
+    )
+    _CONTEXT_FIELDS = (
+        "lead_time_data_points",
+        "deployment_count",
+        "failed_deployment_count",
+        "mttr_data_points",
+    )
+    _LEAD_TIME_STATISTICS = tuple((key, f"lead_time_{key}") for key in _STATISTIC_KEYS)
+    _MTTR_STATISTICS = tuple((key, f"mttr_{key}") for key in _STATISTIC_KEYS)
+    _CONFIG_METRICS = ("lead_time", "deployment_frequency", "change_failure_rate", "mttr")
+    
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         result = {
             "period_start": self.period_start.isoformat(),
             "period_end": self.period_end.isoformat(),
-            "metrics": {
-                "lead_time_for_changes_hours": self.lead_time_for_changes,
-                "deployment_frequency_per_day": self.deployment_frequency,
-                "change_failure_rate_percent": self.change_failure_rate,
-                "mean_time_to_restore_hours": self.mean_time_to_restore,
-            },
-            "context": {
-                "lead_time_data_points": self.lead_time_data_points,
-                "deployment_count": self.deployment_count,
-                "failed_deployment_count": self.failed_deployment_count,
-                "mttr_data_points": self.mttr_data_points,
-            },
+            "metrics": {key: getattr(self, attr) for key, attr in self._METRIC_FIELDS},
+            "context": {attr: getattr(self, attr) for attr in self._CONTEXT_FIELDS},
         }
         
         # Add lead time statistics if available
         if self.lead_time_data_points > 0:
             result["lead_time_statistics"] = {
-                "p50": self.lead_time_p50,
-                "p90": self.lead_time_p90,
-                "p95": self.lead_time_p95,
-                "mean": self.lead_time_mean,
-                "std_dev": self.lead_time_std_dev,
-                "min": self.lead_time_min,
-                "max": self.lead_time_max,
+                key: getattr(self, attr) for key, attr in self._LEAD_TIME_STATISTICS
             }
         
         # Add MTTR statistics if available
         if self.mttr_data_points > 0:
             result["mttr_statistics"] = {
-                "p50": self.mttr_p50,
-                "p90": self.mttr_p90,
-                "p95": self.mttr_p95,
-                "mean": self.mttr_mean,
-                "std_dev": self.mttr_std_dev,
-                "min": self.mttr_min,
-                "max": self.mttr_max,
+                key: getattr(self, attr) for key, attr in self._MTTR_STATISTICS
             }
         
         # Add config section if available
         if self.config:
-            result["config"] = {
-                "lead_time": {
-                    "period": self.config.lead_time.period.value,
-                    "method": self.config.lead_time.method.value,
-                },
-                "deployment_frequency": {
-                    "period": self.config.deployment_frequency.period.value,
-                    "method": self.config.deployment_frequency.method.value,
-                },
-                "change_failure_rate": {
-                    "period": self.config.change_failure_rate.period.value,
-                    "method": self.config.change_failure_rate.method.value,
-                },
-                "mttr": {
-                    "period": self.config.mttr.period.value,
-                    "method": self.config.mttr.method.value,
-                },
-                "reporting_period": self.config.reporting_period.value,
-            }
+            config_section: Dict[str, Any] = {}
+            for name in self._CONFIG_METRICS:
+                metric_config = getattr(self.config, name)
+                config_section[name] = {
+                    "period": metric_config.period.value,
+                    "method": metric_config.method.value,
+                }
+            config_section["reporting_period"] = self.config.reporting_period.value
+            result["config"] = config_section
         
         return result
         
     def to_json(self) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        return orjson.dumps(self.to_dict(), option=_JSON_OPTIONS).decode()
+
+
+@dataclass(frozen=True, eq=False)
+class MetricsResultTable:
+    """
+    Columnar (one NumPy array per field) view of a series of DORAMetrics.
+    
+    Lets callers aggregate across periods with vectorized NumPy operations
+    instead of looping over DORAMetrics objects. Unavailable metric values are
+    NaN, and period bounds are datetime64 values in UTC.
+    """
+    metrics: Tuple[DORAMetrics, ...]
+    period_start: np.ndarray
+    period_end: np.ndarray
+    lead_time_for_changes: np.ndarray
+    deployment_frequency: np.ndarray
+    change_failure_rate: np.ndarray
+    mean_time_to_restore: np.ndarray
+    lead_time_data_points: np.ndarray
+    deployment_count: np.ndarray
+    failed_deployment_count: np.ndarray
+    mttr_data_points: np.ndarray
+    
+    @classmethod
+    def from_metrics(cls, metrics: List[DORAMetrics]) -> "MetricsResultTable":
+        """Build the table from calculate() results."""
+        def floats(name: str) -> np.ndarray:
+            return np.array(
+                [np.nan if getattr(m, name) is None else getattr(m, name) for m in metrics],
+                dtype=np.float64,
+            )
+            
+        def ints(name: str) -> np.ndarray:
+            return np.array([getattr(m, name) for m in metrics], dtype=np.int64)
+            
+        def times(name: str) -> np.ndarray:
+            stamps = pd.to_datetime([getattr(m, name) for m in metrics], utc=True)
+            values: np.ndarray = stamps.tz_convert(None).to_numpy()
+            return values
+            
+        return cls(
+            metrics=tuple(metrics),
+            period_start=times("period_start"),
+            period_end=times("period_end"),
+            lead_time_for_changes=floats("lead_time_for_changes"),
+            deployment_frequency=floats("deployment_frequency"),
+            change_failure_rate=floats("change_failure_rate"),
+            mean_time_to_restore=floats("mean_time_to_restore"),
+            lead_time_data_points=ints("lead_time_data_points"),
+            deployment_count=ints("deployment_count"),
+            failed_deployment_count=ints("failed_deployment_count"),
+            mttr_data_points=ints("mttr_data_points"),
+        )
+        
+    def __len__(self) -> int:
+        return len(self.metrics)
+        
+    def __getitem__(self, index: int) -> DORAMetrics:
+        return self.metrics[index]
+
+
+@lru_cache(maxsize=512)
+def _period_boundaries(
+    start_date: datetime,
+    start_tz: Optional[tzinfo],
+    end_date: datetime,
+    end_tz: Optional[tzinfo],
+    next_start: Callable[[datetime], datetime],
+) -> Tuple[Tuple[datetime, datetime], ...]:
+    """
+    Build (start, end) pairs covering [start_date, end_date), one per reporting period.
+    
+    The time zones are only part of the cache key: aware datetimes for the same
+    instant compare equal but fall on different calendar boundaries.
+    """
+    periods = []
+    current = start_date
+    
+    while current < end_date:
+        # Don't exceed end_date
+        period_end = min(next_start(current), end_date)
+        periods.append((current, period_end))
+        current = period_end
+        
+    return tuple(periods)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch (naive treated as UTC)."""
+    epoch = _EPOCH if value.tzinfo is not None else _EPOCH_NAIVE
+    return (value - epoch) // _ONE_MICROSECOND
+
+
+def _us_to_hours(durations_us: np.ndarray) -> np.ndarray:
+    """Convert integer microsecond durations to fractional hours in one step."""
+    return np.asarray(durations_us, dtype=np.int64) / _US_PER_HOUR
+
+
+def _hour_statistics(hours: np.ndarray) -> Dict[str, Optional[float]]:
+    """Summarize a non-empty array of durations in hours."""
+    p50, p90, p95 = np.percentile(hours, [50, 90, 95])
+    return {
+        'p50': p50,
+        'p90': p90,
+        'p95': p95,
+        'mean': np.mean(hours),
+        'std_dev': np.std(hours) if len(hours) > 1 else 0.0,
+        'min': np.min(hours),
+        'max': np.max(hours),
+    }
 
 
 class MetricsCalculator:
@@ -216,8 +391,10 @@ class MetricsCalculator:
         self.commits_by_sha: Dict[str, Commit] = {}
         self.prs_by_number: Dict[int, PullRequest] = {}
         self.deployments_by_tag: Dict[str, Deployment] = {}
-        self.all_deployments: List[Tuple[datetime, Commit, Optional[Deployment]]] = []
-        self.commits_ordered: List[Commit] = []
+        self.all_deployments: List[DeploymentRecord] = []
+        self.deployment_times_us: np.ndarray = np.empty(0, dtype=np.int64)
+        self.commits_by_authored: List[Commit] = []
+        self.commit_authored_us: np.ndarray = np.empty(0, dtype=np.int64)
         
     def calculate(
         self,
@@ -226,7 +403,8 @@ class MetricsCalculator:
         deployments: List[Deployment],
         start_date: datetime,
         end_date: datetime,
-        config: Optional[MetricsConfig] = None
+        config: Optional[MetricsConfig] = None,
+        max_workers: Optional[int] = None
     ) -> List[DORAMetrics]:
         """
         Calculate DORA metrics for the given time period.
@@ -238,6 +416,8 @@ class MetricsCalculator:
             start_date: Start of analysis period
             end_date: End of analysis period
             config: Configuration for metric calculations
+            max_workers: Calculate periods on a thread pool of this size (serial
+                when unset, or when there are too few periods to be worth it)
             
         Returns:
             List of DORAMetrics for each reporting period
@@ -254,7 +434,14 @@ class MetricsCalculator:
         # Get reporting period boundaries
         periods = self._get_period_boundaries(start_date, end_date, config.reporting_period)
         
-        # Calculate metrics for each reporting period
+        # Calculate metrics for each reporting period; periods only read the
+        # lookups built above, so they can run concurrently
+        if max_workers and max_workers > 1 and len(periods) >= _PARALLEL_MIN_PERIODS:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(
+                    lambda p: self._calculate_period_metrics(p[0], p[1], config), periods
+                ))
+                
         results = []
         for period_start, period_end in periods:
             metrics = self._calculate_period_metrics(period_start, period_end, config)
@@ -273,11 +460,18 @@ class MetricsCalculator:
         self.prs_by_number = {pr.number: pr for pr in pull_requests}
         self.deployments_by_tag = {d.tag_name: d for d in deployments}
         
-        # Keep ordered list of commits for finding ranges
-        self.commits_ordered = sorted(commits, key=lambda c: c.committed_date)
+        # Commits ordered by authored date, with epoch microseconds precomputed
+        # so deployment ranges can be found by binary search
+        self.commits_by_authored = sorted(commits, key=lambda c: c.authored_date)
+        self.commit_authored_us = np.array(
+            [_to_epoch_us(c.authored_date) for c in self.commits_by_authored], dtype=np.int64
+        )
         
         # Build complete deployment list for tracking previous deployments
         self.all_deployments = self._get_all_deployments_sorted()
+        self.deployment_times_us = np.array(
+            [_to_epoch_us(d.time) for d in self.all_deployments], dtype=np.int64
+        )
         
     def _get_period_boundaries(
         self,
@@ -297,42 +491,15 @@ class MetricsCalculator:
             # 90-day rolling window: report weekly
             period = Period.WEEKLY
             
-        periods = []
-        current = start_date
-        
-        while current < end_date:
-            if period == Period.DAILY:
-                period_end = current + timedelta(days=1)
-            elif period == Period.WEEKLY:
-                # Week starts on Monday
-                days_until_sunday = 6 - current.weekday()
-                period_end = current + timedelta(days=days_until_sunday + 1)
-            elif period == Period.MONTHLY:
-                # Find first day of next month
-                if current.month == 12:
-                    period_end = current.replace(year=current.year + 1, month=1, day=1)
-                else:
-                    period_end = current.replace(month=current.month + 1, day=1)
-            elif period == Period.QUARTERLY:
-                # Find first day of next quarter
-                current_quarter = (current.month - 1) // 3
-                if current_quarter == 3:  # Q4
-                    period_end = current.replace(year=current.year + 1, month=1, day=1)
-                else:
-                    next_quarter_month = (current_quarter + 1) * 3 + 1
-                    period_end = current.replace(month=next_quarter_month, day=1)
-            elif period == Period.YEARLY:
-                # Find first day of next year
-                period_end = current.replace(year=current.year + 1, month=1, day=1)
-            else:
-                raise ValueError(f"Unknown period type: {period}")
-                    
-            # Don't exceed end_date
-            period_end = min(period_end, end_date)
-            periods.append((current, period_end))
-            current = period_end
+        next_start = _PERIOD_STEPS.get(period)
+        if next_start is None:
+            raise ValueError(f"Unknown period type: {period}")
             
-        return periods
+        return list(
+            _period_boundaries(
+                start_date, start_date.tzinfo, end_date, end_date.tzinfo, next_start
+            )
+        )
         
     def _calculate_period_metrics(
         self,
@@ -341,9 +508,12 @@ class MetricsCalculator:
         config: MetricsConfig
     ) -> DORAMetrics:
         """Calculate metrics for a single reporting period using configured methods."""
+        # Metrics sharing a data window (e.g. all period-based) reuse one lookup
+        windows: DeploymentWindows = {}
+        
         # Calculate lead time with statistics
         deployments = self._get_deployments_for_metric(
-            period_start, period_end, config.lead_time
+            period_start, period_end, config.lead_time, windows
         )
         lead_time, lt_points, lt_stats = self._calculate_lead_time(
             deployments, period_start, period_end
@@ -351,24 +521,27 @@ class MetricsCalculator:
         
         # Calculate deployment frequency
         deploy_freq, deploy_count = self._calculate_metric(
-            period_start, period_end, config.deployment_frequency, self._calculate_deployment_frequency
+            period_start, period_end, config.deployment_frequency,
+            self._calculate_deployment_frequency, windows
         )
         
         # Calculate failure rate
         failure_rate, failed_count = self._calculate_metric(
-            period_start, period_end, config.change_failure_rate, self._calculate_change_failure_rate
+            period_start, period_end, config.change_failure_rate,
+            self._calculate_change_failure_rate, windows
         )
         
         # Calculate MTTR with statistics
         deployments = self._get_deployments_for_metric(
-            period_start, period_end, config.mttr
+            period_start, period_end, config.mttr, windows
         )
         mttr, mttr_points, mttr_stats = self._calculate_mttr(
             deployments, period_start, period_end
         )
         
-        # Create metrics object
-        metrics = DORAMetrics(
+        # Create metrics object; statistics are empty dicts when unavailable, so
+        # those fields keep their None defaults
+        return DORAMetrics(
             lead_time_for_changes=lead_time,
             deployment_frequency=deploy_freq,
             change_failure_rate=failure_rate,
@@ -380,37 +553,23 @@ class MetricsCalculator:
             failed_deployment_count=int(failed_count) if failed_count else 0,
             mttr_data_points=mttr_points,
             config=config,
+            **{f"lead_time_{name}": value for name, value in lt_stats.items()},
+            **{f"mttr_{name}": value for name, value in mttr_stats.items()},
         )
         
-        # Add lead time statistics if available
-        if lt_stats:
-            metrics.lead_time_p50 = lt_stats.get('p50')
-            metrics.lead_time_p90 = lt_stats.get('p90')
-            metrics.lead_time_p95 = lt_stats.get('p95')
-            metrics.lead_time_mean = lt_stats.get('mean')
-            metrics.lead_time_std_dev = lt_stats.get('std_dev')
-            metrics.lead_time_min = lt_stats.get('min')
-            metrics.lead_time_max = lt_stats.get('max')
-        
-        # Add MTTR statistics if available
-        if mttr_stats:
-            metrics.mttr_p50 = mttr_stats.get('p50')
-            metrics.mttr_p90 = mttr_stats.get('p90')
-            metrics.mttr_p95 = mttr_stats.get('p95')
-            metrics.mttr_mean = mttr_stats.get('mean')
-            metrics.mttr_std_dev = mttr_stats.get('std_dev')
-            metrics.mttr_min = mttr_stats.get('min')
-            metrics.mttr_max = mttr_stats.get('max')
-        
-        return metrics
-        
     def _get_deployments_for_metric(
         self,
         period_start: datetime,
         period_end: datetime,
-        metric_config: MetricConfig
-    ) -> List[Tuple[datetime, Commit, Optional[Deployment]]]:
-        """Get deployments for a specific metric based on its configuration."""
+        metric_config: MetricConfig,
+        windows: Optional[DeploymentWindows] = None
+    ) -> List[DeploymentRecord]:
+        """
+        Get deployments for a specific metric based on its configuration.
+        
+        Windows already looked up for this period end are reused from `windows`,
+        keyed by window start.
+        """
         # Determine the data window based on configuration
         if metric_config.method == CalculationMethod.ROLLING_WINDOW:
             window_days = metric_config.get_window_days()
@@ -424,14 +583,19 @@ class MetricsCalculator:
             data_start = period_start
             
         # Get deployments in the data window
-        return self._get_deployments_in_period(data_start, period_end)
+        if windows is None:
+            return self._get_deployments_in_period(data_start, period_end)
+        if data_start not in windows:
+            windows[data_start] = self._get_deployments_in_period(data_start, period_end)
+        return windows[data_start]
     
     def _calculate_metric(
         self,
         period_start: datetime,
         period_end: datetime,
         metric_config: MetricConfig,
-        calculation_func
+        calculation_func,
+        windows: Optional[DeploymentWindows] = None
     ) -> Tuple[Optional[float], int]:
         """
         Calculate a single metric using its configuration.
@@ -440,7 +604,9 @@ class MetricsCalculator:
             Tuple of (metric_value, data_point_count)
         """
         # Get deployments for this metric
-        deployments = self._get_deployments_for_metric(period_start, period_end, metric_config)
+        deployments = self._get_deployments_for_metric(
+            period_start, period_end, metric_config, windows
+        )
         
         # Calculate the metric
         return calculation_func(deployments, period_start, period_end)
@@ -449,35 +615,20 @@ class MetricsCalculator:
         self,
         start_date: datetime,
         end_date: datetime
-    ) -> List[Tuple[datetime, Commit, Optional[Deployment]]]:
+    ) -> List[DeploymentRecord]:
         """
         Get all deployments (GitHub and manual) in the period.
         
         Returns:
-            List of (deployment_time, commit, deployment) tuples
+            List of deployment records
         """
-        deployments = []
-        
-        # GitHub deployments
-        for deployment in self.deployments_by_tag.values():
-            deploy_time = deployment.published_at or deployment.created_at
-            if start_date <= deploy_time < end_date:
-                if deployment.commit_sha in self.commits_by_sha:
-                    commit = self.commits_by_sha[deployment.commit_sha]
-                    deployments.append((deploy_time, commit, deployment))
-                    
-        # Manual deployments from commits
-        for commit in self.commits_by_sha.values():
-            if getattr(commit, "is_manual_deployment", None):
-                deploy_time = getattr(commit, "manual_deployment_timestamp", commit.committed_date)
-                if start_date <= deploy_time < end_date:
-                    deployments.append((deploy_time, commit, None))
-                    
-        # Sort by deployment time
-        deployments.sort(key=lambda x: x[0])
-        return deployments
+        # all_deployments is already joined to commits and sorted by time
+        lo, hi = np.searchsorted(
+            self.deployment_times_us, [_to_epoch_us(start_date), _to_epoch_us(end_date)]
+        )
+        return self.all_deployments[lo:hi]
         
-    def _get_all_deployments_sorted(self) -> List[Tuple[datetime, Commit, Optional[Deployment]]]:
+    def _get_all_deployments_sorted(self) -> List[DeploymentRecord]:
         """Get all deployments sorted by time (for finding previous deployments)."""
         deployments = []
         
@@ -486,21 +637,25 @@ class MetricsCalculator:
             deploy_time = deployment.published_at or deployment.created_at
             if deployment.commit_sha in self.commits_by_sha:
                 commit = self.commits_by_sha[deployment.commit_sha]
-                deployments.append((deploy_time, commit, deployment))
+                deployments.append(DeploymentRecord(
+                    deploy_time, commit, deployment, self._is_deployment_failed(deployment)
+                ))
                 
         # Manual deployments from commits
         for commit in self.commits_by_sha.values():
             if getattr(commit, "is_manual_deployment", None):
                 deploy_time = getattr(commit, "manual_deployment_timestamp", commit.committed_date)
-                deployments.append((deploy_time, commit, None))
+                deployments.append(DeploymentRecord(
+                    deploy_time, commit, None, self._is_deployment_failed(commit)
+                ))
                 
         # Sort by deployment time
-        deployments.sort(key=lambda x: x[0])
+        deployments.sort(key=lambda x: x.time)
         return deployments
         
     def _calculate_lead_time(
         self,
-        deployments: List[Tuple[datetime, Commit, Optional[Deployment]]],
+        deployments: List[DeploymentRecord],
         start_date: datetime,
         end_date: datetime
     ) -> Tuple[Optional[float], int, Dict[str, Optional[float]]]:
@@ -515,41 +670,31 @@ class MetricsCalculator:
         if not deployments:
             return None, 0, {}
             
-        lead_times = []
+        lead_us = []
         
-        for deploy_time, deploy_commit, deployment in deployments:
-            # Get all commits in this deployment
-            commits_in_deployment = self._get_commits_in_deployment(
+        for deploy_time, deploy_commit, deployment, _ in deployments:
+            # Lead times of all commits in this deployment, in integer microseconds
+            start, end = self._get_commit_range(
                 deployment if deployment else deploy_commit,
                 deploy_time
             )
+            lead_us.append(_to_epoch_us(deploy_time) - self.commit_authored_us[start:end])
             
-            for commit in commits_in_deployment:
-                lead_time = (deploy_time - commit.authored_date).total_seconds() / 3600
-                # Only count positive lead times (commit before deployment)
-                if lead_time >= 0:
-                    lead_times.append(lead_time)
+        lead_times = _us_to_hours(np.concatenate(lead_us))
+        # Only count positive lead times (commit before deployment)
+        lead_times = lead_times[lead_times >= 0]
                     
-        if not lead_times:
+        if lead_times.size == 0:
             return None, 0, {}
             
         # Calculate comprehensive statistics
-        lead_times_array = np.array(lead_times)
-        statistics = {
-            'p50': np.percentile(lead_times_array, 50),
-            'p90': np.percentile(lead_times_array, 90),
-            'p95': np.percentile(lead_times_array, 95),
-            'mean': np.mean(lead_times_array),
-            'std_dev': np.std(lead_times_array) if len(lead_times) > 1 else 0.0,
-            'min': np.min(lead_times_array),
-            'max': np.max(lead_times_array),
-        }
+        statistics = _hour_statistics(lead_times)
             
         return statistics['p50'], len(lead_times), statistics
         
     def _calculate_deployment_frequency(
         self,
-        deployments: List[Tuple[datetime, Commit, Optional[Deployment]]],
+        deployments: List[DeploymentRecord],
         start_date: datetime,
         end_date: datetime
     ) -> Tuple[float, int]:
@@ -561,11 +706,8 @@ class MetricsCalculator:
         Returns:
             Tuple of (deployments_per_day, total_deployment_count)
         """
-        # Filter out failed deployments
-        successful_deployments = [
-            d for d in deployments
-            if not self._is_deployment_failed(d[2] if d[2] else d[1])
-        ]
+        # Exclude failed deployments
+        successful = len(deployments) - sum(map(_record_failed, deployments))
         
         # Calculate days in period
         days = (end_date - start_date).total_seconds() / 86400
@@ -573,11 +715,11 @@ class MetricsCalculator:
         if days == 0:
             return 0.0, 0
             
-        return len(successful_deployments) / days, len(successful_deployments)
+        return successful / days, successful
         
     def _calculate_change_failure_rate(
         self,
-        deployments: List[Tuple[datetime, Commit, Optional[Deployment]]],
+        deployments: List[DeploymentRecord],
         start_date: datetime,
         end_date: datetime
     ) -> Tuple[Optional[float], int]:
@@ -590,16 +732,14 @@ class MetricsCalculator:
         if not deployments:
             return None, 0
             
-        failed = sum(
-            1 for d in deployments
-            if self._is_deployment_failed(d[2] if d[2] else d[1])
-        )
+        # Failure flags are resolved once when the lookups are built
+        failed = sum(map(_record_failed, deployments))
         
         return failed / len(deployments), failed
         
     def _calculate_mttr(
         self,
-        deployments: List[Tuple[datetime, Commit, Optional[Deployment]]],
+        deployments: List[DeploymentRecord],
         start_date: datetime,
         end_date: datetime
     ) -> Tuple[Optional[float], int, Dict[str, Optional[float]]]:
@@ -611,34 +751,29 @@ class MetricsCalculator:
         Returns:
             Tuple of (median_restore_time_hours, number_of_restorations, statistics_dict)
         """
-        restore_times = []
+        restore_us = []
         
-        for deploy_time, commit, deployment in deployments:
-            if deployment and self._is_deployment_failed(deployment):
+        for deploy_time, commit, deployment, failed in deployments:
+            if not failed:
+                continue
+            if deployment:
                 # GitHub deployment failure
                 if hasattr(deployment, "failure_resolved_at") and deployment.failure_resolved_at:
-                    restore_time = (deployment.failure_resolved_at - deploy_time).total_seconds() / 3600
-                    restore_times.append(restore_time)
-            elif self._is_deployment_failed(commit):
+                    restore_us.append(
+                        _to_epoch_us(deployment.failure_resolved_at) - _to_epoch_us(deploy_time)
+                    )
+            else:
                 # Manual deployment failure
                 # For manual deployments, we need to find the next successful deployment
                 # This is a limitation - users should provide failure_resolved_at in CSV
                 pass
                 
-        if not restore_times:
+        if not restore_us:
             return None, 0, {}
             
         # Calculate comprehensive statistics
-        restore_times_array = np.array(restore_times)
-        statistics = {
-            'p50': np.percentile(restore_times_array, 50),
-            'p90': np.percentile(restore_times_array, 90),
-            'p95': np.percentile(restore_times_array, 95),
-            'mean': np.mean(restore_times_array),
-            'std_dev': np.std(restore_times_array) if len(restore_times) > 1 else 0.0,
-            'min': np.min(restore_times_array),
-            'max': np.max(restore_times_array),
-        }
+        restore_times = _us_to_hours(np.array(restore_us, dtype=np.int64))
+        statistics = _hour_statistics(restore_times)
             
         return statistics['p50'], len(restore_times), statistics
         
@@ -652,48 +787,53 @@ class MetricsCalculator:
         
         This includes all commits since the previous deployment.
         """
-        commits = []
+        start, end = self._get_commit_range(deployment, deploy_time)
+        return self.commits_by_authored[start:end]
+        
+    def _get_commit_range(
+        self,
+        deployment: Union[Deployment, Commit],
+        deploy_time: Optional[datetime] = None
+    ) -> Tuple[int, int]:
+        """
+        Get the slice of commits_by_authored included in a deployment.
         
-        # Get deployment commit
+        Returns:
+            Tuple of (start, end) indices; empty if the deployment commit is unknown
+        """
         if isinstance(deployment, Deployment):
             if deployment.commit_sha not in self.commits_by_sha:
-                return []
-            deployment_commit = self.commits_by_sha[deployment.commit_sha]
+                return 0, 0
             if not deploy_time:
                 deploy_time = deployment.published_at or deployment.created_at
         else:
             # Manual deployment
-            deployment_commit = deployment
             if not deploy_time:
-                deploy_time = getattr(deployment, "manual_deployment_timestamp", deployment.committed_date)
+                deploy_time = getattr(
+                    deployment, "manual_deployment_timestamp", deployment.committed_date
+                )
         
-        # Find previous deployment
+        # Find previous deployment (the last one strictly before deploy_time)
         prev_deployment = None
         prev_deploy_time = None
         
-        for d_time, d_commit, d_deployment in self.all_deployments:
-            if d_time < deploy_time:
-                prev_deployment = d_deployment if d_deployment else d_commit
-                prev_deploy_time = d_time
-            else:
-                break
-        
-        # Get all commits between previous deployment and this one
-        if prev_deployment:
-            # Find commits after previous deployment and up to current deployment time
-            for commit in self.commits_ordered:
-                # Include commits authored after the previous deployment
-                # and before or at the deployment time
-                if (commit.authored_date > prev_deploy_time and 
-                    commit.authored_date <= deploy_time):
-                    commits.append(commit)
-        else:
-            # First deployment - include all commits up to deployment time
-            for commit in self.commits_ordered:
-                if commit.authored_date <= deploy_time:
-                    commits.append(commit)
-        
-        return commits
+        prev_index = np.searchsorted(self.deployment_times_us, _to_epoch_us(deploy_time)) - 1
+        if prev_index >= 0:
+            prev_deploy_time, d_commit, d_deployment, _ = self.all_deployments[prev_index]
+            prev_deployment = d_deployment if d_deployment else d_commit
+        
+        # Get all commits authored after the previous deployment (if any) and
+        # before or at the deployment time
+        start = 0
+        if prev_deployment and prev_deploy_time is not None:
+            start = int(np.searchsorted(
+                self.commit_authored_us, _to_epoch_us(prev_deploy_time), side="right"
+            ))
+        end = int(np.searchsorted(
+            self.commit_authored_us, _to_epoch_us(deploy_time), side="right"
+        ))
+        
+        return start, end
         
     def _is_deployment_failed(self, deployment: Union[Deployment, Commit]) -> bool:
         """Check if a deployment failed."""
@@ -29,9 +29,10 @@ class DataRepository:
     def load_commits(self, repo_name: str) -> List[Commit]:
         """Load commits for a repository."""
         path = f"{repo_name}/commits.json"
-        if not self.storage.exists(path):
+        try:
+            data = self.storage.read_json(path)
+        except FileNotFoundError:
             return []
-        data = self.storage.read_json(path)
         return [Commit.from_dict(item) for item in data]
     
     def save_pull_requests(self, repo_name: str, prs: List[PullRequest]) -> None:
@@ -43,9 +44,10 @@ class DataRepository:
     def load_pull_requests(self, repo_name: str) -> List[PullRequest]:
         """Load pull requests for a repository."""
         path = f"{repo_name}/pull_requests.json"
-        if not self.storage.exists(path):
+        try:
+            data = self.storage.read_json(path)
+        except FileNotFoundError:
             return []
-        data = self.storage.read_json(path)
         return [PullRequest.from_dict(item) for item in data]
     
     def save_deployments(self, repo_name: str, deployments: List[Deployment]) -> None:
@@ -57,9 +59,10 @@ class DataRepository:
     def load_deployments(self, repo_name: str) -> List[Deployment]:
         """Load deployments for a repository."""
         path = f"{repo_name}/deployments.json"
-        if not self.storage.exists(path):
+        try:
+            data = self.storage.read_json(path)
+        except FileNotFoundError:
             return []
-        data = self.storage.read_json(path)
         return [Deployment.from_dict(item) for item in data]
     
     def save_metadata(self, repo_name: str, metadata: Dict) -> None:
@@ -70,9 +73,10 @@ class DataRepository:
     def load_metadata(self, repo_name: str) -> Dict:
         """Load metadata for a repository."""
         path = f"{repo_name}/metadata.json"
-        if not self.storage.exists(path):
+        try:
+            return self.storage.read_json(path)
+        except FileNotFoundError:
             return {}
-        return self.storage.read_json(path)
     
     def update_metadata(self, repo_name: str, updates: Dict) -> None:
         """Update metadata for a repository."""
@@ -1,28 +1,162 @@
-"""Storage abstraction for local filesystem and S3."""
+"""Storage abstraction for local filesystem, in-memory and S3."""
 
+import asyncio
 import json
+import os
+import stat
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import orjson
 
 from ..logging import get_logger
 
 logger = get_logger(__name__)
 
+# Worker threads shared by batch writes and deletes of one storage manager
+_POOL_WORKERS = 8
+
+# Directory listings and file contents are cached only once they have been
+# unchanged for this long, comfortably above common filesystem timestamp granularity
+_SETTLE_NS = 2_000_000_000
+
+# Number of JSON files whose raw content read_json keeps between calls
+_JSON_CACHE_SIZE = 64
+
+# orjson options matching json.dumps(default=str): NumPy values and non-string
+# keys are accepted, and datetimes go through default=str ("2024-01-01 00:00:00")
+# rather than orjson's own ISO 8601 form. NaN and infinities are written as null.
+_JSON_OPTIONS = (
+    orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+)
+
+# File content accepted by writes: text, or bytes already encoded as UTF-8
+FileContent = Union[str, bytes]
+
+# Flags for raw file descriptor I/O (O_CLOEXEC/O_BINARY only exist on some platforms)
+_READ_FLAGS = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+_APPEND_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_APPEND
+    | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def _read_file(path: Union[str, Path]) -> bytes:
+    """Read a whole file with raw os.read calls, sized from fstat."""
+    fd = os.open(path, _READ_FLAGS)
+    try:
+        size = os.fstat(fd).st_size
+        # Reads may return fewer bytes than asked for (network filesystems,
+        # signals), so only an empty read marks EOF
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _write_file(path: Union[str, Path], data: bytes, flags: int = _WRITE_FLAGS) -> None:
+    """Replace (or with _APPEND_FLAGS, extend) a file's contents with raw os.write calls."""
+    # 0o666 lets the process umask decide the final mode, as open() does
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def _decode_text(data: bytes) -> str:
+    """Decode UTF-8 text with universal newlines, as text-mode reads do."""
+    text = data.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _encode_text(content: "FileContent") -> bytes:
+    """Encode text as UTF-8 with platform line endings, as text-mode writes do.
+
+    Content that is already bytes is written unchanged.
+    """
+    if isinstance(content, bytes):
+        return content
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    return content.encode("utf-8")
+
 
 class StorageBackend(ABC):
     """Abstract base class for storage backends."""
 
+    # Whether batch operations gain from running on several threads, i.e. the
+    # backend spends its time waiting on system calls or the network
+    supports_parallel_io: bool = False
+
     @abstractmethod
     def read(self, path: str) -> str:
         """Read file content as string."""
         pass
 
     @abstractmethod
-    def write(self, path: str, content: str) -> None:
-        """Write string content to file."""
+    def write(self, path: str, content: FileContent) -> None:
+        """Write string (or UTF-8 encoded bytes) content to file."""
         pass
 
+    def read_bytes(self, path: str) -> bytes:
+        """Read raw file content; backends may override to skip text decoding."""
+        return self.read(path).encode("utf-8")
+
+    def write_bytes(self, path: str, data: bytes) -> None:
+        """Write raw file content; backends may override to skip text encoding."""
+        self.write(path, data.decode("utf-8"))
+
+    def append_bytes(self, path: str, data: bytes) -> None:
+        """Append raw content to a file; backends may override to avoid a rewrite."""
+        try:
+            existing = self.read_bytes(path)
+        except FileNotFoundError:
+            existing = b""
+        self.write_bytes(path, existing + data)
+
+    def version(self, path: str) -> Optional[Tuple[int, int]]:
+        """Get a token that changes whenever the file does, or None if there is none."""
+        return None
+
+    def write_many(self, items: List[Tuple[str, FileContent]]) -> None:
+        """Write several files; backends may override to share per-call setup."""
+        for path, content in items:
+            self.write(path, content)
+
     @abstractmethod
     def exists(self, path: str) -> bool:
         """Check if file exists."""
@@ -38,77 +172,282 @@ class StorageBackend(ABC):
         """Delete a file."""
         pass
 
+    def delete_many(self, paths: Iterable[str]) -> None:
+        """Delete several files; backends may override to share per-call setup."""
+        for path in paths:
+            self.delete(path)
+
+
+class _DirListing(NamedTuple):
+    """Names in a directory, as of the directory's modification time."""
+    mtime_ns: int
+    files: Tuple[str, ...]
+    subdirs: Tuple[str, ...]
+
 
 class LocalStorageBackend(StorageBackend):
     """Local filesystem storage backend."""
 
+    supports_parallel_io = True
+
     def __init__(self, base_path: Union[str, Path]):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        # Plain string paths are used internally; Path only at the public boundary
+        self._base_str = str(self.base_path)
+        # Directories known to exist, so repeated writes skip the mkdir call
+        self._known_dirs: Set[str] = {self._base_str}
+        # Resolved paths are cached per backend, since callers reuse the same names
+        self._full_path = lru_cache(maxsize=4096)(self._join_path)
+        # Directory listings by full path, reused by list() while the
+        # directory's mtime is unchanged
+        self._listings: Dict[str, _DirListing] = {}
         logger.info(f"Initialized local storage at {self.base_path}")
 
-    def _full_path(self, path: str) -> Path:
+    def _join_path(self, path: str) -> str:
         """Get full path by joining base path with given path."""
-        return self.base_path / path
+        return os.path.join(self._base_str, path)
 
     def read(self, path: str) -> str:
         """Read file content as string."""
+        return _decode_text(self.read_bytes(path))
+
+    def read_bytes(self, path: str) -> bytes:
+        """Read raw file content."""
         full_path = self._full_path(path)
         logger.debug(f"Reading from {full_path}")
         try:
-            return full_path.read_text(encoding="utf-8")
+            return _read_file(full_path)
         except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {path}")
         except Exception as e:
             logger.error(f"Error reading {path}: {e}")
             raise
 
-    def write(self, path: str, content: str) -> None:
-        """Write string content to file."""
+    def write(self, path: str, content: FileContent) -> None:
+        """Write string (or UTF-8 encoded bytes) content to file."""
+        full_path = self._full_path(path)
+        self._ensure_dir(os.path.dirname(full_path))
+        self._write_encoded(path, full_path, _encode_text(content))
+
+    def write_bytes(self, path: str, data: bytes) -> None:
+        """Write raw file content."""
+        full_path = self._full_path(path)
+        self._ensure_dir(os.path.dirname(full_path))
+        self._write_encoded(path, full_path, data)
+
+    def write_many(self, items: List[Tuple[str, FileContent]]) -> None:
+        """Write several files, creating each distinct parent directory once."""
+        targets = [(path, self._full_path(path), content) for path, content in items]
+        for directory in {os.path.dirname(full_path) for _, full_path, _ in targets}:
+            self._ensure_dir(directory)
+        for path, full_path, content in targets:
+            self._write_encoded(path, full_path, _encode_text(content))
+
+    def append_bytes(self, path: str, data: bytes) -> None:
+        """Append raw content to a file, creating it if needed."""
         full_path = self._full_path(path)
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(os.path.dirname(full_path))
+        self._write_encoded(path, full_path, data, _APPEND_FLAGS)
+
+    def _write_encoded(self, path: str, full_path: str, data: bytes,
+                       flags: int = _WRITE_FLAGS) -> None:
+        """Write encoded content to a file whose directory has been ensured."""
         logger.debug(f"Writing to {full_path}")
         try:
-            full_path.write_text(content, encoding="utf-8")
+            try:
+                _write_file(full_path, data, flags)
+            except FileNotFoundError:
+                # Directory was removed outside this backend since it was cached
+                directory = os.path.dirname(full_path)
+                self._known_dirs.discard(directory)
+                self._ensure_dir(directory)
+                _write_file(full_path, data, flags)
         except Exception as e:
             logger.error(f"Error writing {path}: {e}")
             raise
 
     def exists(self, path: str) -> bool:
         """Check if file exists."""
-        return self._full_path(path).exists()
+        return os.path.exists(self._full_path(path))
+
+    def version(self, path: str) -> Optional[Tuple[int, int]]:
+        """Get the file's modification time and size, or None if it changed too recently."""
+        try:
+            st = os.stat(self._full_path(path))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {path}")
+        # A same-size rewrite within the filesystem's timestamp granularity
+        # would leave both unchanged, so recently modified files get no version
+        if time.time_ns() - st.st_mtime_ns < _SETTLE_NS:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _ensure_dir(self, directory: str) -> None:
+        """Create a directory (and parents) unless it is already known to exist."""
+        if directory not in self._known_dirs:
+            os.makedirs(directory, exist_ok=True)
+            # Its ancestors exist now as well, so writes to them skip makedirs too
+            while directory not in self._known_dirs:
+                self._known_dirs.add(directory)
+                parent = os.path.dirname(directory)
+                if parent == directory:
+                    break
+                directory = parent
 
     def list(self, prefix: str) -> List[str]:
         """List all files with given prefix."""
-        prefix_path = self._full_path(prefix)
-        if prefix_path.is_dir():
-            # List all files in directory
-            files = []
-            for item in prefix_path.rglob("*"):
-                if item.is_file():
-                    rel_path = item.relative_to(self.base_path)
-                    files.append(str(rel_path))
+        # Normalized like Path, so a trailing separator names the directory itself
+        prefix_path = os.path.normpath(self._full_path(prefix))
+        listing = self._scan_dir(prefix_path)
+        if listing is not None:
+            # List all files in directory (recursively, without following
+            # symlinked directories)
+            files: List[str] = []
+            stack = [(prefix_path, self._relative(prefix_path), listing)]
+            while stack:
+                directory, rel_dir, listing = stack.pop()
+                files.extend(
+                    os.path.join(rel_dir, name) if rel_dir else name for name in listing.files
+                )
+                for name in listing.subdirs:
+                    subdir = os.path.join(directory, name)
+                    sub_listing = self._scan_dir(subdir)
+                    if sub_listing is not None:
+                        rel_path = os.path.join(rel_dir, name) if rel_dir else name
+                        stack.append((subdir, rel_path, sub_listing))
             return sorted(files)
+
+        # List files matching prefix
+        parent, prefix_name = os.path.split(prefix_path)
+        listing = self._scan_dir(parent)
+        if listing is None:
+            return []
+        rel_dir = self._relative(parent)
+        return sorted(
+            os.path.join(rel_dir, name) if rel_dir else name
+            for name in listing.files if name.startswith(prefix_name)
+        )
+
+    def _scan_dir(self, directory: str) -> Optional[_DirListing]:
+        """
+        Get a directory's file and subdirectory names, or None if it is not a directory.
+
+        A cached listing is reused while the directory's mtime is unchanged, so
+        changes made by other processes or storage managers are still seen.
+        """
+        try:
+            st = os.stat(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            self._listings.pop(directory, None)
+            return None
+        if not stat.S_ISDIR(st.st_mode):
+            self._listings.pop(directory, None)
+            return None
+        cached = self._listings.get(directory)
+        if cached is not None and cached.mtime_ns == st.st_mtime_ns:
+            return cached
+
+        files = []
+        subdirs = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+        listing = _DirListing(st.st_mtime_ns, tuple(files), tuple(subdirs))
+        # A second change within the filesystem's timestamp granularity would
+        # leave the mtime unchanged, so only listings older than that are kept
+        if time.time_ns() - st.st_mtime_ns >= _SETTLE_NS:
+            self._listings[directory] = listing
         else:
-            # List files matching prefix
-            parent = prefix_path.parent
-            if not parent.exists():
-                return []
-
-            files = []
-            prefix_name = prefix_path.name
-            for item in parent.iterdir():
-                if item.is_file() and item.name.startswith(prefix_name):
-                    rel_path = item.relative_to(self.base_path)
-                    files.append(str(rel_path))
-            return sorted(files)
+            self._listings.pop(directory, None)
+        return listing
+
+    def _relative(self, directory: str) -> str:
+        """Get a directory's path relative to the base path ("" for the base itself)."""
+        rel_dir = os.path.relpath(directory, self._base_str)
+        return "" if rel_dir == os.curdir else rel_dir
 
     def delete(self, path: str) -> None:
         """Delete a file."""
-        full_path = self._full_path(path)
-        if full_path.exists():
-            logger.debug(f"Deleting {full_path}")
-            full_path.unlink()
+        self.delete_many((path,))
+
+    def delete_many(self, paths: Iterable[str]) -> None:
+        """Delete several files, ignoring any that do not exist."""
+        full_path = self._full_path
+        for path in paths:
+            target = full_path(path)
+            logger.debug(f"Deleting {target}")
+            try:
+                os.unlink(target)
+            except FileNotFoundError:
+                pass
+
+
+class MemoryStorageBackend(StorageBackend):
+    """In-memory storage backend, for tests and short-lived runs."""
+
+    def __init__(self) -> None:
+        self._files: Dict[str, bytes] = {}
+        logger.info("Initialized in-memory storage")
+
+    @staticmethod
+    def _key(path: str) -> str:
+        """Normalize a path the way the filesystem would resolve it."""
+        return os.path.normpath(path)
+
+    def read(self, path: str) -> str:
+        """Read file content as string."""
+        return _decode_text(self.read_bytes(path))
+
+    def read_bytes(self, path: str) -> bytes:
+        """Read raw file content."""
+        try:
+            return self._files[self._key(path)]
+        except KeyError:
+            raise FileNotFoundError(f"File not found: {path}")
+
+    def write(self, path: str, content: FileContent) -> None:
+        """Write string (or UTF-8 encoded bytes) content to file."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        self._files[self._key(path)] = bytes(content)
+
+    def write_bytes(self, path: str, data: bytes) -> None:
+        """Write raw file content."""
+        self._files[self._key(path)] = bytes(data)
+
+    def append_bytes(self, path: str, data: bytes) -> None:
+        """Append raw content to a file, creating it if needed."""
+        key = self._key(path)
+        self._files[key] = self._files.get(key, b"") + data
+
+    def exists(self, path: str) -> bool:
+        """Check if file exists."""
+        return self._key(path) in self._files
+
+    def list(self, prefix: str) -> List[str]:
+        """List all files with given prefix."""
+        key = self._key(prefix)
+        if key == os.curdir:
+            return sorted(self._files)
+        # A prefix naming a directory lists it recursively, as on disk
+        directory = key + os.sep
+        files = [path for path in self._files if path.startswith(directory)]
+        if not files:
+            # Otherwise match file names within the prefix's directory
+            parent = os.path.dirname(key)
+            files = [
+                path for path in self._files
+                if path.startswith(key) and os.path.dirname(path) == parent
+            ]
+        return sorted(files)
+
+    def delete(self, path: str) -> None:
+        """Delete a file."""
+        self._files.pop(self._key(path), None)
 
 
 class StorageManager:
@@ -119,16 +458,23 @@ class StorageManager:
         Initialize storage manager.
 
         Args:
-            storage_type: Type of storage backend ("local" or "s3")
+            storage_type: Type of storage backend ("local", "memory" or "s3")
             **kwargs: Backend-specific arguments
                 For local: base_path (default: "./data")
                 For s3: bucket, prefix (to be implemented)
         """
         self.storage_type = storage_type
+        self._pool: Optional[ThreadPoolExecutor] = None
+        # Raw JSON content by path, with the backend version it was read at
+        self._json_cache: "OrderedDict[str, Tuple[Tuple[int, int], bytes]]" = OrderedDict()
+        self._json_cache_lock = threading.Lock()
 
+        self.backend: StorageBackend
         if storage_type == "local":
             base_path = kwargs.get("base_path", "./data")
             self.backend = LocalStorageBackend(base_path)
+        elif storage_type == "memory":
+            self.backend = MemoryStorageBackend()
         elif storage_type == "s3":
             raise NotImplementedError("S3 storage backend not yet implemented")
         else:
@@ -142,17 +488,144 @@ class StorageManager:
 
     def read_json(self, path: str) -> dict:
         """Read and parse JSON file."""
-        content = self.read(path)
-        return json.loads(content)
+        return orjson.loads(self._read_json_bytes(path))
 
-    def write(self, path: str, content: str) -> None:
-        """Write string content to file."""
+    def _read_json_bytes(self, path: str) -> bytes:
+        """Get a JSON file's content, reusing the last read while the file is unchanged.
+
+        Only the raw bytes are kept: parsing them again is cheaper than deep-copying
+        a parsed result, and callers may freely modify what read_json returns.
+        """
+        version = self.backend.version(path)
+        if version is None:
+            return self.backend.read_bytes(path)
+        with self._json_cache_lock:
+            cached = self._json_cache.get(path)
+            if cached is not None and cached[0] == version:
+                self._json_cache.move_to_end(path)
+                return cached[1]
+        data = self.backend.read_bytes(path)
+        with self._json_cache_lock:
+            self._json_cache[path] = (version, data)
+            self._json_cache.move_to_end(path)
+            if len(self._json_cache) > _JSON_CACHE_SIZE:
+                self._json_cache.popitem(last=False)
+        return data
+
+    def _forget(self, paths: Iterable[str]) -> None:
+        """Drop cached content for paths this manager is changing."""
+        if self._json_cache:
+            with self._json_cache_lock:
+                for path in paths:
+                    self._json_cache.pop(path, None)
+
+    def write(self, path: str, content: FileContent) -> None:
+        """Write string (or UTF-8 encoded bytes) content to file."""
+        self._forget((path,))
         self.backend.write(path, content)
 
+    def write_many(
+        self,
+        items: Union[Mapping[str, FileContent], Iterable[Tuple[str, FileContent]]],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Write several files in one batch.
+
+        Args:
+            items: Mapping of path to content, or (path, content) pairs; a path
+                given more than once is written with its last content
+            max_workers: Number of threads to spread the batch over (default:
+                inline for small batches, all pool workers for larger ones)
+        """
+        # Deduplicate so no two threads write the same file
+        pairs = list(dict(items.items() if isinstance(items, Mapping) else items).items())
+        self._forget(path for path, _ in pairs)
+        self._run_batch(self.backend.write_many, pairs, max_workers)
+
+    async def awrite_many(
+        self,
+        items: Union[Mapping[str, FileContent], Iterable[Tuple[str, FileContent]]],
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Write several files in one batch without blocking the event loop.
+
+        Args:
+            items: Mapping of path to content, or (path, content) pairs
+            max_workers: Number of threads to spread the batch over, as for write_many
+        """
+        pairs = list(items.items() if isinstance(items, Mapping) else items)
+        await asyncio.to_thread(self.write_many, pairs, max_workers)
+
     def write_json(self, path: str, data: dict, indent: int = 2) -> None:
         """Write data as JSON file."""
-        content = json.dumps(data, indent=indent, default=str)
-        self.write(path, content)
+        if indent in (None, 2):
+            option = (_JSON_OPTIONS | orjson.OPT_INDENT_2) if indent else _JSON_OPTIONS
+            # orjson produces UTF-8 bytes, which are stored as-is
+            self._forget((path,))
+            self.backend.write_bytes(path, orjson.dumps(data, default=str, option=option))
+        else:
+            # orjson only supports two-space indentation
+            self.write(path, json.dumps(data, indent=indent, default=str))
+
+    def append_json_array(self, path: str, item: Any, key: Optional[str] = None) -> None:
+        """
+        Append an item to a JSON array, creating the file if it is missing.
+
+        Without a key the file holds a top-level array, and the encoded item is
+        spliced in before the closing bracket, so the existing elements are neither
+        parsed nor re-serialized. With a key the array is that member of a top-level
+        object (e.g. ``{"commits": [...]}``); its end cannot be found without
+        parsing, so the object is read and written back whole.
+        """
+        if key is not None:
+            try:
+                document = orjson.loads(self.backend.read_bytes(path))
+            except FileNotFoundError:
+                document = {}
+            if not isinstance(document, dict) or not isinstance(document.get(key, []), list):
+                raise ValueError(f"JSON file does not hold an array at {key!r}: {path}")
+            document.setdefault(key, []).append(item)
+            self.write_json(path, document)
+            return
+
+        encoded = orjson.dumps(item, default=str, option=_JSON_OPTIONS)
+        try:
+            data = self.backend.read_bytes(path).rstrip()
+        except FileNotFoundError:
+            data = b"[]"
+        if not (data.lstrip().startswith(b"[") and data.endswith(b"]")):
+            raise ValueError(f"JSON file does not hold an array: {path}")
+        head = data[:-1].rstrip()
+        separator = b"" if head.endswith(b"[") else b","
+        self._forget((path,))
+        self.backend.write_bytes(path, head + separator + encoded + b"]")
+
+    def append_jsonl(self, path: str, item: Any) -> None:
+        """Append one item as a line of a JSON Lines file, creating it if needed."""
+        self._forget((path,))
+        line = orjson.dumps(item, default=str, option=_JSON_OPTIONS) + b"\n"
+        self.backend.append_bytes(path, line)
+
+    def write_jsonl(self, path: str, items: Iterable[Any]) -> None:
+        """
+        Write items as a JSON Lines file, one JSON document per line.
+
+        Also converts an existing JSON array, e.g.
+        ``write_jsonl("commits.jsonl", read_json("commits.json"))``.
+        """
+        data = b"".join(
+            orjson.dumps(item, default=str, option=_JSON_OPTIONS) + b"\n" for item in items
+        )
+        self._forget((path,))
+        self.backend.write_bytes(path, data)
+
+    def iter_jsonl(self, path: str) -> Iterator[Any]:
+        """Iterate over the items of a JSON Lines file, skipping blank lines."""
+        # Read eagerly so a missing file raises here rather than on first iteration
+        data = self.backend.read_bytes(path)
+        return (orjson.loads(line) for line in data.splitlines() if line.strip())
 
     def exists(self, path: str) -> bool:
         """Check if file exists."""
@@ -164,4 +637,47 @@ class StorageManager:
 
     def delete(self, path: str) -> None:
         """Delete a file."""
+        self._forget((path,))
         self.backend.delete(path)
+
+    def delete_many(self, paths: Iterable[str], max_workers: Optional[int] = None) -> None:
+        """
+        Delete several files, ignoring any that do not exist.
+
+        Args:
+            paths: Paths to delete
+            max_workers: Number of threads to spread the batch over, as for write_many
+        """
+        paths = list(paths)
+        self._forget(paths)
+        self._run_batch(self.backend.delete_many, paths, max_workers)
+
+    def _run_batch(self, operation: Callable[[List[Any]], None], items: List[Any],
+                   max_workers: Optional[int]) -> None:
+        """Run a batch operation inline, or in slices on the shared thread pool."""
+        if max_workers is None:
+            max_workers = _POOL_WORKERS if len(items) > _POOL_WORKERS else 1
+        slices = min(max_workers, len(items))
+        if slices <= 1 or not self.backend.supports_parallel_io:
+            operation(items)
+            return
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=_POOL_WORKERS, thread_name_prefix="storage-io"
+            )
+        # One slice per worker, so each thread shares its per-call setup
+        chunks = [items[i::slices] for i in range(slices)]
+        # Consume the results so the first failure raises here
+        list(self._pool.map(operation, chunks))
+
+    def close(self) -> None:
+        """Shut down the batch thread pool, if one was started."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "StorageManager":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
@@ -6,10 +6,13 @@ import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
 
+import git
 import pytest
 from click.testing import CliRunner
 
 from dora_metrics.cli import cli
+from dora_metrics.storage.repository import DataRepository
+from dora_metrics.storage.storage_manager import StorageManager
 
 
 @pytest.mark.e2e
@@ -44,7 +47,6 @@ class TestCLIEndToEnd:
             until_str = until_date.strftime("%Y-%m-%d")
             
             # 1. Clone the repository first
-            import git
             repo_path = Path(storage_dir) / repo
             print(f"Cloning {owner}/{repo}...")
             git_repo = git.Repo.clone_from(
@@ -216,7 +218,6 @@ class TestCLIEndToEnd:
             
             # Clone repository
             repo_path = Path(storage_dir) / repo
-            import git
             git.Repo.clone_from(
                 f"https://github.com/{owner}/{repo}.git",
                 str(repo_path)
@@ -233,9 +234,6 @@ class TestCLIEndToEnd:
             assert result.exit_code == 0
             
             # Get initial commit count
-            from dora_metrics.storage.repository import DataRepository
-            from dora_metrics.storage.storage_manager import StorageManager
-            
             storage = StorageManager(base_path=Path(storage_dir))
             data_repo = DataRepository(storage)
             initial_commits = data_repo.load_commits(repo)
@@ -260,7 +258,6 @@ class TestCLIEndToEnd:
             
             # Clone the repository
             repo_path = Path(storage_dir) / "hello-world"
-            import git
             git_repo = git.Repo.clone_from(
                 f"https://github.com/{owner}/{repo}.git",
                 str(repo_path)
@@ -333,7 +330,6 @@ class TestCLIEndToEnd:
             
             # Clone repository
             repo_path = Path(storage_dir) / "test-repo"
-            import git
             git.Repo.clone_from(
                 f"https://github.com/{owner}/{repo}.git",
                 str(repo_path)
@@ -130,7 +130,6 @@ class TestCSVWorkflows:
         handler.export_commits(commits, csv_path)
         
         # Simulate human editing the CSV
-        import csv
         rows = []
         with open(csv_path, "r", encoding="utf-8-sig") as f:
             reader = csv.DictReader(f)
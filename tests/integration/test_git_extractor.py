@@ -1,6 +1,7 @@
 """Integration tests for git extractor with real repositories."""
 
 import os
+import shutil
 import sys
 import tempfile
 from datetime import datetime, timedelta, timezone
@@ -224,5 +225,4 @@ class TestGitExtractorIntegration:
             
         finally:
             # Clean up temporary directory
-            import shutil
             shutil.rmtree(repo_path)
\ No newline at end of file
@@ -757,7 +757,6 @@ class TestMetricsScenarios:
         deployments.append(deployment3)
         
         # Calculate metrics incrementally to show how the day unfolds
-        from dora_metrics.calculators.metrics import MetricsConfig
         config = MetricsConfig.daily_all()
         
         # Metric snapshot 1: After initial deployment (10am)
@@ -1,25 +1,45 @@
 """Integration tests for storage manager."""
 
+import asyncio
+
 import pytest
 
 from dora_metrics.storage import StorageManager
 
+# Pre-encoded JSON documents, written as bytes without an encoding step
+COMMITS_EMPTY = b'{"commits": []}'
+PRS_EMPTY = b'{"prs": []}'
+# 1MB of content for the large file test
+LARGE_CONTENT = "x" * (1024 * 1024)
+
+
+@pytest.fixture(scope="module")
+def storage(tmp_path_factory):
+    """Create one storage manager shared by the module's tests."""
+    base_path = tmp_path_factory.mktemp("storage")
+    with StorageManager(storage_type="local", base_path=str(base_path)) as storage:
+        yield storage
+
+
+@pytest.fixture(autouse=True)
+def clean_storage(storage):
+    """Remove every file the previous test left in the shared storage."""
+    yield
+    storage.delete_many(storage.list(""))
+
 
 @pytest.mark.integration
 class TestStorageManagerIntegration:
     """Integration tests for storage manager with real file operations."""
 
-    @pytest.fixture
-    def storage(self, tmp_path):
-        """Create a storage manager with tmp_path."""
-        return StorageManager(storage_type="local", base_path=str(tmp_path))
-
     def test_complex_workflow(self, storage):
         """Test a complex workflow with multiple operations."""
         # Write multiple files
-        storage.write("raw/commits.json", '{"commits": []}')
-        storage.write("raw/prs.json", '{"prs": []}')
-        storage.write("processed/data.csv", "id,name\n1,test")
+        storage.write_many([
+            ("raw/commits.json", COMMITS_EMPTY),
+            ("raw/prs.json", PRS_EMPTY),
+            ("processed/data.csv", "id,name\n1,test"),
+        ], max_workers=4)
 
         # List all files
         all_files = storage.list("")
@@ -40,11 +60,48 @@ class TestStorageManagerIntegration:
         assert updated_data["commits"][0]["sha"] == "abc123"
 
         # Clean up
-        for file in all_files:
-            storage.delete(file)
+        storage.delete_many(all_files, max_workers=4)
 
         assert storage.list("") == []
 
+    def test_append_json_array_workflow(self, storage):
+        """Test appending to JSON arrays without a read_json/write_json round trip."""
+        storage.write_many([
+            ("raw/commits.json", COMMITS_EMPTY),
+            ("raw/tags.json", b"[]"),
+        ])
+
+        storage.append_json_array("raw/commits.json", {"sha": "abc123"}, key="commits")
+        storage.append_json_array("raw/commits.json", {"sha": "def456"}, key="commits")
+        storage.append_json_array("raw/tags.json", "v1.0.0")
+
+        commits = storage.read_json("raw/commits.json")["commits"]
+        assert [commit["sha"] for commit in commits] == ["abc123", "def456"]
+        assert storage.read_json("raw/tags.json") == ["v1.0.0"]
+
+    def test_jsonl_workflow(self, storage):
+        """Test the complex workflow with append-only JSON Lines files."""
+        storage.write_jsonl("raw/commits.jsonl", [])
+        storage.write_jsonl("raw/prs.jsonl", [{"number": 1}])
+
+        assert storage.list("raw/") == ["raw/commits.jsonl", "raw/prs.jsonl"]
+
+        # Append without rewriting existing entries
+        storage.append_jsonl("raw/commits.jsonl", {"sha": "abc123"})
+        storage.append_jsonl("raw/commits.jsonl", {"sha": "def456"})
+
+        commits = list(storage.iter_jsonl("raw/commits.jsonl"))
+        assert [commit["sha"] for commit in commits] == ["abc123", "def456"]
+
+    def test_async_batch_write(self, storage):
+        """Test writing a batch from a coroutine."""
+        items = [(f"async/file_{i}.txt", f"content_{i}") for i in range(10)]
+
+        asyncio.run(storage.awrite_many(items, max_workers=4))
+
+        assert storage.list("async/") == sorted(path for path, _ in items)
+        assert storage.read("async/file_3.txt") == "content_3"
+
     def test_concurrent_operations(self, storage):
         """Test concurrent read/write operations."""
         # This would test thread safety if we implement it later
@@ -65,8 +122,7 @@ class TestStorageManagerIntegration:
 
     def test_large_file_handling(self, storage):
         """Test handling of large files."""
-        # Create a large content (1MB)
-        large_content = "x" * (1024 * 1024)
+        large_content = LARGE_CONTENT
         path = "large_file.txt"
 
         storage.write(path, large_content)
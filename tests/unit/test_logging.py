@@ -1,8 +1,7 @@
 """Unit tests for logging configuration."""
 
 import logging
-import tempfile
-from pathlib import Path
+import sys
 
 import pytest
 
@@ -21,57 +20,81 @@ class TestLogging:
         logger = logging.getLogger()
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
+            handler.close()
 
-    def test_setup_logging_default(self, caplog):
-        """Test default logging setup."""
-        setup_logging()
+    def test_setup_logging_default(self):
+        """Test default logging setup configures an INFO-level stdout handler."""
+        root_logger = logging.getLogger()
+        original_level = root_logger.level
+        # Clear any existing handlers first, so basicConfig installs its own
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+
+        try:
+            setup_logging()
+
+            assert root_logger.level == logging.INFO
+            assert len(root_logger.handlers) == 1
+            handler = root_logger.handlers[0]
+            assert isinstance(handler, logging.StreamHandler)
+            assert handler.stream is sys.stdout
+
+            # Format: timestamp - logger name - level - message
+            record = logging.LogRecord(
+                "test.module", logging.INFO, __file__, 1, "Test message", None, None
+            )
+            assert handler.format(record).endswith(" - test.module - INFO - Test message")
+        finally:
+            root_logger.setLevel(original_level)
+
+    def test_info_level_filters_debug(self, caplog):
+        """Test INFO-level logging keeps info messages and drops debug ones."""
+        caplog.set_level(logging.INFO, logger="test")
         logger = get_logger("test")
 
-        with caplog.at_level(logging.INFO):
-            logger.info("Test info message")
-            logger.debug("Test debug message")  # Should not appear with INFO level
+        logger.info("Test info message")
+        logger.debug("Test debug message")  # Should not appear with INFO level
 
         assert "Test info message" in caplog.text
         assert "Test debug message" not in caplog.text
 
-    def test_setup_logging_debug_level(self, caplog):
+    def test_setup_logging_debug_level(self):
         """Test logging with DEBUG level."""
-        setup_logging(level="DEBUG")
-        logger = get_logger("test")
+        root_logger = logging.getLogger()
+        original_level = root_logger.level
+        # Clear any existing handlers first, so basicConfig installs its own
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
 
-        with caplog.at_level(logging.DEBUG):
-            logger.debug("Test debug message")
+        try:
+            setup_logging(level="DEBUG")
 
-        assert "Test debug message" in caplog.text
+            assert root_logger.level == logging.DEBUG
+            assert get_logger("test").isEnabledFor(logging.DEBUG)
+        finally:
+            root_logger.setLevel(original_level)
 
-    def test_setup_logging_with_file(self):
+    def test_setup_logging_with_file(self, tmp_path):
         """Test logging to file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False) as f:
-            log_file = f.name
-
-        try:
-            # Clear any existing handlers first
-            root_logger = logging.getLogger()
-            for handler in root_logger.handlers[:]:
-                root_logger.removeHandler(handler)
+        log_file = tmp_path / "test.log"
 
-            setup_logging(log_file=log_file)
-            logger = get_logger("test")
+        # Clear any existing handlers first
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
 
-            logger.info("Test file message")
+        setup_logging(log_file=str(log_file))
+        logger = get_logger("test")
 
-            # Force flush all handlers
-            logging.shutdown()
+        logger.info("Test file message")
 
-            # Re-initialize handlers after shutdown
-            setup_logging(log_file=log_file)
+        # Flush handlers so the message reaches the file
+        for handler in root_logger.handlers:
+            handler.flush()
 
-            # Check file content
-            content = Path(log_file).read_text()
-            assert "Test file message" in content
-        finally:
-            if Path(log_file).exists():
-                Path(log_file).unlink()
+        # Check file content
+        content = log_file.read_text()
+        assert "Test file message" in content
 
     def test_third_party_loggers_suppressed(self, capsys):
         """Test that third-party loggers are set to WARNING."""
@@ -95,15 +118,13 @@ class TestLogging:
         assert logger2.name == "module2"
         assert logger1 is not logger2
 
-    def test_log_format(self, caplog):
-        """Test that log format includes all expected fields."""
-        setup_logging()
+    def test_log_records_include_name_and_level(self, caplog):
+        """Test that captured log records carry the logger name and level."""
+        caplog.set_level(logging.INFO, logger="test.module")
         logger = get_logger("test.module")
 
-        with caplog.at_level(logging.INFO):
-            logger.info("Test message")
+        logger.info("Test message")
 
-        # Should contain: timestamp - logger name - level - message
         assert "test.module" in caplog.text
         assert "INFO" in caplog.text
         assert "Test message" in caplog.text
@@ -1,7 +1,11 @@
 """Unit tests for metrics calculator."""
 
+import json
+from dataclasses import FrozenInstanceError
 from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
+import numpy as np
 import pytest
 
 from dora_metrics.calculators.metrics import (
@@ -10,9 +14,155 @@ from dora_metrics.calculators.metrics import (
     MetricConfig,
     MetricsCalculator,
     MetricsConfig,
+    MetricsResultTable,
     Period,
 )
-from dora_metrics.models import Commit, Deployment, PullRequest
+from dora_metrics.models import Commit, Deployment
+
+BASE_DATE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+DAY = timedelta(days=1)
+HOUR = timedelta(hours=1)
+
+# Shared empty input for the no-deployment checks (only ever iterated)
+NO_DEPLOYMENTS = ()
+
+
+def _make_commit(sha: str, authored_date: datetime, message: str, **kwargs) -> Commit:
+    """Build a commit authored and committed by the same developer at the same time."""
+    return Commit(
+        sha=sha,
+        author_name="Dev",
+        author_email="dev@example.com",
+        authored_date=authored_date,
+        committer_name="Dev",
+        committer_email="dev@example.com",
+        committed_date=authored_date,
+        message=message,
+        **kwargs,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_commits():
+    """Create sample commits for testing."""
+    return [
+        _make_commit(
+            f"commit{i}",
+            BASE_DATE + i * DAY,
+            f"Commit {i}",
+            files_changed=[f"file{i}.py"],
+            additions=10,
+            deletions=5,
+            deployment_tag="v1.0.0" if i == 2 else None,
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.fixture(scope="module")
+def sample_manual_deployments():
+    """Create commits with manual deployment annotations."""
+    commits = []
+    
+    # Successful deployment
+    commit1 = _make_commit(
+        "manual1",
+        BASE_DATE + 5 * DAY,
+        "Manual deployment 1",
+        files_changed=["deploy.py"],
+        additions=50,
+        deletions=10,
+        is_manual_deployment=True,
+        manual_deployment_timestamp=BASE_DATE + 6 * DAY,
+        manual_deployment_failed=False,
+    )
+    commits.append(commit1)
+    
+    # Failed deployment
+    commit2 = _make_commit(
+        "manual2",
+        BASE_DATE + 10 * DAY,
+        "Manual deployment 2",
+        files_changed=["app.py"],
+        additions=20,
+        deletions=5,
+        is_manual_deployment=True,
+        manual_deployment_timestamp=BASE_DATE + 11 * DAY,
+        manual_deployment_failed=True,
+    )
+    commits.append(commit2)
+    
+    return commits
+
+
+@pytest.fixture(scope="module")
+def sample_deployments():
+    """Create sample deployments."""
+    deployments = []
+    
+    # Successful deployment on Jan 3 for commit2 (authored Jan 3)
+    deploy1 = Deployment(
+        tag_name="v1.0.0",
+        name="Release 1.0.0",
+        created_at=BASE_DATE + 2 * DAY,  # Jan 3
+        published_at=BASE_DATE + 2 * DAY + HOUR,  # Jan 3, 1 hour later
+        commit_sha="commit2",
+        is_prerelease=False,
+    )
+    deployments.append(deploy1)
+    
+    # Failed deployment on Jan 8 for commit4
+    deploy2 = Deployment(
+        tag_name="v1.1.0",
+        name="Release 1.1.0",
+        created_at=BASE_DATE + 7 * DAY,  # Jan 8
+        published_at=BASE_DATE + 7 * DAY + 2 * HOUR,  # Jan 8, 2 hours later
+        commit_sha="commit4",
+        is_prerelease=False,
+        deployment_failed=True,
+        failure_resolved_at=BASE_DATE + 7 * DAY + 6 * HOUR,
+    )
+    deployments.append(deploy2)
+    
+    return deployments
+
+
+@pytest.fixture(scope="module")
+def loaded_calculator(sample_commits, sample_deployments):
+    """Create a calculator with lookups built from the sample data (read-only)."""
+    calculator = MetricsCalculator()
+    calculator._build_lookups(sample_commits, [], sample_deployments)
+    return calculator
+
+
+@pytest.fixture(scope="module")
+def daily_results(sample_commits, sample_deployments):
+    """Calculate daily metrics over the sample data once for the assertions."""
+    return MetricsCalculator().calculate(
+        sample_commits,
+        [],
+        sample_deployments,
+        BASE_DATE,
+        BASE_DATE + 4 * DAY,
+        MetricsConfig.daily_all(),
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_metrics():
+    """Create a populated metrics result shared by the serialization tests."""
+    return DORAMetrics(
+        lead_time_for_changes=24.5,
+        deployment_frequency=2.0,
+        change_failure_rate=0.1,
+        mean_time_to_restore=4.0,
+        period_start=BASE_DATE,
+        period_end=BASE_DATE + DAY,
+        lead_time_data_points=10,
+        deployment_count=5,
+        failed_deployment_count=1,
+        mttr_data_points=1,
+    )
 
 
 @pytest.mark.unit
@@ -24,107 +174,6 @@ class TestMetricsCalculator:
         """Create a metrics calculator."""
         return MetricsCalculator()
         
-    @pytest.fixture
-    def sample_commits(self):
-        """Create sample commits for testing."""
-        base_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        return [
-            Commit(
-                sha=f"commit{i}",
-                author_name="Dev",
-                author_email="dev@example.com",
-                authored_date=base_date + timedelta(days=i),
-                committer_name="Dev",
-                committer_email="dev@example.com",
-                committed_date=base_date + timedelta(days=i),
-                message=f"Commit {i}",
-                files_changed=[f"file{i}.py"],
-                additions=10,
-                deletions=5,
-                deployment_tag="v1.0.0" if i == 2 else None,
-            )
-            for i in range(5)
-        ]
-        
-    @pytest.fixture
-    def sample_manual_deployments(self):
-        """Create commits with manual deployment annotations."""
-        base_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        commits = []
-        
-        # Successful deployment
-        commit1 = Commit(
-            sha="manual1",
-            author_name="Dev",
-            author_email="dev@example.com",
-            authored_date=base_date + timedelta(days=5),
-            committer_name="Dev",
-            committer_email="dev@example.com",
-            committed_date=base_date + timedelta(days=5),
-            message="Manual deployment 1",
-            files_changed=["deploy.py"],
-            additions=50,
-            deletions=10,
-        )
-        commit1.is_manual_deployment = True
-        commit1.manual_deployment_timestamp = base_date + timedelta(days=6)
-        commit1.manual_deployment_failed = False
-        commits.append(commit1)
-        
-        # Failed deployment
-        commit2 = Commit(
-            sha="manual2",
-            author_name="Dev",
-            author_email="dev@example.com",
-            authored_date=base_date + timedelta(days=10),
-            committer_name="Dev",
-            committer_email="dev@example.com",
-            committed_date=base_date + timedelta(days=10),
-            message="Manual deployment 2",
-            files_changed=["app.py"],
-            additions=20,
-            deletions=5,
-        )
-        commit2.is_manual_deployment = True
-        commit2.manual_deployment_timestamp = base_date + timedelta(days=11)
-        commit2.manual_deployment_failed = True
-        commits.append(commit2)
-        
-        return commits
-        
-    @pytest.fixture
-    def sample_deployments(self):
-        """Create sample deployments."""
-        base_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        
-        deployments = []
-        
-        # Successful deployment on Jan 3 for commit2 (authored Jan 3)
-        deploy1 = Deployment(
-            tag_name="v1.0.0",
-            name="Release 1.0.0",
-            created_at=base_date + timedelta(days=2),  # Jan 3
-            published_at=base_date + timedelta(days=2, hours=1),  # Jan 3, 1 hour later
-            commit_sha="commit2",
-            is_prerelease=False,
-        )
-        deployments.append(deploy1)
-        
-        # Failed deployment on Jan 8 for commit4
-        deploy2 = Deployment(
-            tag_name="v1.1.0",
-            name="Release 1.1.0",
-            created_at=base_date + timedelta(days=7),  # Jan 8
-            published_at=base_date + timedelta(days=7, hours=2),  # Jan 8, 2 hours later
-            commit_sha="commit4",
-            is_prerelease=False,
-        )
-        deploy2.deployment_failed = True
-        deploy2.failure_resolved_at = base_date + timedelta(days=7, hours=6)
-        deployments.append(deploy2)
-        
-        return deployments
-        
     def test_period_boundaries_daily(self, calculator):
         """Test daily period boundary calculation."""
         start = datetime(2024, 1, 1, tzinfo=timezone.utc)
@@ -157,6 +206,78 @@ class TestMetricsCalculator:
         assert periods[1][0] == datetime(2024, 1, 8, tzinfo=timezone.utc)
         assert periods[1][1] == datetime(2024, 1, 15, tzinfo=timezone.utc)
         
+    def test_period_boundaries_weekly_partial_first_week(self, calculator):
+        """Test weekly boundaries starting mid-week keep the start time of day."""
+        start = datetime(2024, 1, 3, 9, 30, tzinfo=timezone.utc)  # Wednesday
+        end = datetime(2024, 1, 17, tzinfo=timezone.utc)
+        
+        periods = calculator._get_period_boundaries(start, end, Period.WEEKLY)
+        
+        assert periods == [
+            (start, datetime(2024, 1, 8, 9, 30, tzinfo=timezone.utc)),
+            (
+                datetime(2024, 1, 8, 9, 30, tzinfo=timezone.utc),
+                datetime(2024, 1, 15, 9, 30, tzinfo=timezone.utc),
+            ),
+            (datetime(2024, 1, 15, 9, 30, tzinfo=timezone.utc), end),
+        ]
+        
+    def test_period_boundaries_weekly_end_earlier_in_day(self, calculator):
+        """Test the last weekly boundary is kept when end is earlier in the day than start."""
+        start = datetime(2023, 4, 17, 13, 30, tzinfo=timezone.utc)  # Monday
+        end = datetime(2023, 5, 10, tzinfo=timezone.utc)
+        
+        periods = calculator._get_period_boundaries(start, end, Period.WEEKLY)
+        
+        assert [period_start for period_start, _ in periods] == [
+            start,
+            datetime(2023, 4, 24, 13, 30, tzinfo=timezone.utc),
+            datetime(2023, 5, 1, 13, 30, tzinfo=timezone.utc),
+            datetime(2023, 5, 8, 13, 30, tzinfo=timezone.utc),
+        ]
+        assert periods[-1][1] == end
+        
+    def test_period_boundaries_daily_across_dst_gap(self, calculator):
+        """Test daily boundaries keep the wall-clock time through a nonexistent local time."""
+        new_york = ZoneInfo("America/New_York")
+        start = datetime(2024, 3, 8, 2, 30, tzinfo=new_york)
+        end = datetime(2024, 3, 12, tzinfo=new_york)
+        
+        periods = calculator._get_period_boundaries(start, end, Period.DAILY)
+        
+        # 2024-03-10 02:30 does not exist in New York (clocks jump from 02:00 to 03:00)
+        assert [period_start for period_start, _ in periods] == [
+            datetime(2024, 3, day, 2, 30, tzinfo=new_york) for day in (8, 9, 10, 11)
+        ]
+        assert periods[-1][1] == end
+        
+    def test_period_boundaries_mixed_time_zones(self, calculator):
+        """Test boundaries follow start_date's zone when end_date is in another zone."""
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 3, 2, 0, tzinfo=timezone(timedelta(hours=2)))  # Jan 3 00:00 UTC
+        
+        periods = calculator._get_period_boundaries(start, end, Period.DAILY)
+        
+        assert periods == [
+            (start, datetime(2024, 1, 2, tzinfo=timezone.utc)),
+            (datetime(2024, 1, 2, tzinfo=timezone.utc), end),
+        ]
+        
+    def test_period_boundaries_cache_respects_time_zone(self, calculator):
+        """Test cached boundaries are not shared between equal instants in other zones."""
+        est = timezone(timedelta(hours=-5))
+        start = datetime(2024, 1, 31, 20, 0, tzinfo=est)  # Feb 1 01:00 UTC
+        end = datetime(2024, 3, 1, tzinfo=est)
+        
+        utc_periods = calculator._get_period_boundaries(
+            start.astimezone(timezone.utc), end.astimezone(timezone.utc), Period.MONTHLY
+        )
+        est_periods = calculator._get_period_boundaries(start, end, Period.MONTHLY)
+        
+        # Same instants, but the first period ends on a different calendar month
+        assert utc_periods[0][1] == datetime(2024, 3, 1, 1, 0, tzinfo=timezone.utc)
+        assert est_periods[0][1] == datetime(2024, 2, 1, 20, 0, tzinfo=est)
+        
     def test_period_boundaries_monthly(self, calculator):
         """Test monthly period boundary calculation."""
         start = datetime(2024, 1, 15, tzinfo=timezone.utc)
@@ -211,93 +332,84 @@ class TestMetricsCalculator:
         assert periods[2][0] == datetime(2025, 1, 1, tzinfo=timezone.utc)
         assert periods[2][1] == datetime(2025, 3, 1, tzinfo=timezone.utc)
         
-    def test_deployment_frequency(self, calculator, sample_commits, sample_deployments):
+    def test_deployment_frequency(self, loaded_calculator):
         """Test deployment frequency calculation."""
-        calculator._build_lookups(sample_commits, [], sample_deployments)
-        
         # Two deployments over 9 days (Jan 1-9)
-        deployments = calculator._get_deployments_in_period(
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 9, tzinfo=timezone.utc)
+        deployments = loaded_calculator._get_deployments_in_period(
+            BASE_DATE,
+            BASE_DATE + 8 * DAY
         )
         
-        freq, count = calculator._calculate_deployment_frequency(
+        freq, count = loaded_calculator._calculate_deployment_frequency(
             deployments,
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 9, tzinfo=timezone.utc)
+            BASE_DATE,
+            BASE_DATE + 8 * DAY
         )
         
         # 1 successful deployment (v1.1.0 failed) over 8 days = 0.125 per day
-        assert freq == 0.125
+        assert freq == pytest.approx(0.125)
         assert count == 1
         
-    def test_change_failure_rate(self, calculator, sample_commits, sample_deployments):
+    def test_change_failure_rate(self, loaded_calculator):
         """Test change failure rate calculation."""
-        calculator._build_lookups(sample_commits, [], sample_deployments)
-        
-        deployments = calculator._get_deployments_in_period(
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 9, tzinfo=timezone.utc)
+        deployments = loaded_calculator._get_deployments_in_period(
+            BASE_DATE,
+            BASE_DATE + 8 * DAY
         )
         
-        rate, failed = calculator._calculate_change_failure_rate(
+        rate, failed = loaded_calculator._calculate_change_failure_rate(
             deployments,
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 9, tzinfo=timezone.utc)
+            BASE_DATE,
+            BASE_DATE + 8 * DAY
         )
         
         # 1 failure out of 2 deployments = 0.5 (50% as ratio)
-        assert rate == 0.5
+        assert rate == pytest.approx(0.5)
         assert failed == 1
         
-    def test_mttr_calculation(self, calculator, sample_commits, sample_deployments):
+    def test_mttr_calculation(self, loaded_calculator):
         """Test MTTR calculation."""
-        calculator._build_lookups(sample_commits, [], sample_deployments)
-        
-        deployments = calculator._get_deployments_in_period(
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 9, tzinfo=timezone.utc)
+        deployments = loaded_calculator._get_deployments_in_period(
+            BASE_DATE,
+            BASE_DATE + 8 * DAY
         )
         
-        mttr, restorations, mttr_stats = calculator._calculate_mttr(
+        mttr, restorations, mttr_stats = loaded_calculator._calculate_mttr(
             deployments,
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 9, tzinfo=timezone.utc)
+            BASE_DATE,
+            BASE_DATE + 8 * DAY
         )
         
         # Failure at hour 2, resolved at hour 6 = 4 hours
-        assert mttr == 4.0
+        assert mttr == pytest.approx(4.0)
         assert restorations == 1
-        assert mttr_stats['p50'] == 4.0  # Only one data point
-        
-    def test_no_deployments(self, calculator):
+        assert mttr_stats['p50'] == pytest.approx(4.0)  # Only one data point
+        
+    @pytest.mark.parametrize(
+        "method,start,end,expected",
+        [
+            ("_calculate_lead_time", None, None, (None, 0, {})),
+            (
+                "_calculate_deployment_frequency",
+                BASE_DATE,
+                BASE_DATE + DAY,
+                (0.0, 0),
+            ),
+            ("_calculate_change_failure_rate", None, None, (None, 0)),
+            ("_calculate_mttr", None, None, (None, 0, {})),
+        ],
+    )
+    def test_no_deployments(self, calculator, method, start, end, expected):
         """Test metrics when there are no deployments."""
-        deployments = []
-        
-        lead_time, _, _ = calculator._calculate_lead_time(deployments, None, None)
-        assert lead_time is None
-        
-        freq, count = calculator._calculate_deployment_frequency(
-            deployments,
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 2, tzinfo=timezone.utc)
-        )
-        assert freq == 0.0
-        assert count == 0
-        
-        rate, _ = calculator._calculate_change_failure_rate(deployments, None, None)
-        assert rate is None
-        
-        mttr, _, _ = calculator._calculate_mttr(deployments, None, None)
-        assert mttr is None
+        assert getattr(calculator, method)(NO_DEPLOYMENTS, start, end) == expected
         
     def test_manual_deployments(self, calculator, sample_manual_deployments):
         """Test metrics with manual deployments."""
         calculator._build_lookups(sample_manual_deployments, [], [])
         
         deployments = calculator._get_deployments_in_period(
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 15, tzinfo=timezone.utc)
+            BASE_DATE,
+            BASE_DATE + 14 * DAY
         )
         
         assert len(deployments) == 2
@@ -305,82 +417,121 @@ class TestMetricsCalculator:
         # Check failure rate
         rate, failed = calculator._calculate_change_failure_rate(
             deployments,
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 15, tzinfo=timezone.utc)
+            BASE_DATE,
+            BASE_DATE + 14 * DAY
         )
         
         # 1 failure out of 2 = 0.5 (50% as ratio)
-        assert rate == 0.5
+        assert rate == pytest.approx(0.5)
         assert failed == 1
         
-    def test_rolling_window(self, calculator, sample_commits, sample_deployments):
-        """Test rolling window calculation."""
-        calculator._build_lookups(sample_commits, [], sample_deployments)
+    def test_build_lookups_sees_in_place_changes(self, calculator, sample_commits):
+        """Test lookups reflect input lists that were modified in place."""
+        commits = list(sample_commits)
+        calculator._build_lookups(commits, [], [])
+        
+        commits[0] = _make_commit("replaced", BASE_DATE + 10 * DAY, "Replaced commit")
+        calculator._build_lookups(commits, [], [])
         
+        assert "replaced" in calculator.commits_by_sha
+        assert calculator.commits_by_authored[-1].sha == "replaced"
+        
+    def test_rolling_window(self, loaded_calculator):
+        """Test rolling window calculation."""
         config = MetricsConfig(
             lead_time=MetricConfig(Period.ROLLING_7_DAYS, CalculationMethod.ROLLING_WINDOW),
             reporting_period=Period.DAILY,
         )
         
         # Calculate for a single day with 7-day rolling window
-        metrics = calculator._calculate_period_metrics(
-            datetime(2024, 1, 10, tzinfo=timezone.utc),
-            datetime(2024, 1, 11, tzinfo=timezone.utc),
+        metrics = loaded_calculator._calculate_period_metrics(
+            BASE_DATE + 9 * DAY,
+            BASE_DATE + 10 * DAY,
             config
         )
         
         # Should include deployments from Jan 4-10 (7 days back from Jan 11)
         assert metrics.lead_time_data_points > 0
         
-    def test_full_calculation(self, calculator, sample_commits, sample_deployments):
+    def test_full_calculation(self, daily_results):
         """Test full metrics calculation."""
-        config = MetricsConfig.daily_all()
-        
-        results = calculator.calculate(
-            sample_commits,
-            [],
-            sample_deployments,
-            datetime(2024, 1, 1, tzinfo=timezone.utc),
-            datetime(2024, 1, 5, tzinfo=timezone.utc),
-            config
-        )
-        
-        assert len(results) == 4  # 4 days
+        assert len(daily_results) == 4  # 4 days
         
         # Check first day has no metrics
-        assert results[0].deployment_count == 0
+        assert daily_results[0].deployment_count == 0
         
         # Check day with deployment
-        day_with_deployment = results[2]  # Jan 3
+        day_with_deployment = daily_results[2]  # Jan 3
         assert day_with_deployment.deployment_count == 1
         assert day_with_deployment.lead_time_for_changes is not None
         
-    def test_metrics_serialization(self):
-        """Test DORAMetrics serialization."""
-        metrics = DORAMetrics(
-            lead_time_for_changes=24.5,
-            deployment_frequency=2.0,
-            change_failure_rate=0.1,
-            mean_time_to_restore=4.0,
-            period_start=datetime(2024, 1, 1, tzinfo=timezone.utc),
-            period_end=datetime(2024, 1, 2, tzinfo=timezone.utc),
-            lead_time_data_points=10,
-            deployment_count=5,
-            failed_deployment_count=1,
-            mttr_data_points=1,
-        )
+    def test_parallel_calculation_matches_serial(
+        self, calculator, sample_commits, sample_deployments
+    ):
+        """Test calculating periods on a thread pool gives the same ordered results."""
+        args = (sample_commits, [], sample_deployments, BASE_DATE, BASE_DATE + 40 * DAY)
+        config = MetricsConfig.daily_all()
         
-        # Test to_dict
-        data = metrics.to_dict()
+        serial = calculator.calculate(*args, config)
+        parallel = calculator.calculate(*args, config, max_workers=4)
+        
+        assert len(parallel) == 40
+        assert parallel == serial
+        
+    def test_metrics_to_dict(self, sample_metrics):
+        """Test DORAMetrics dictionary serialization."""
+        data = sample_metrics.to_dict()
         assert data["metrics"]["lead_time_for_changes_hours"] == 24.5
         assert data["metrics"]["deployment_frequency_per_day"] == 2.0
         assert data["context"]["deployment_count"] == 5
         
-        # Test to_json
-        json_str = metrics.to_json()
+    def test_metrics_to_json(self, sample_metrics):
+        """Test DORAMetrics JSON serialization."""
+        json_str = sample_metrics.to_json()
         assert "lead_time_for_changes_hours" in json_str
         assert "24.5" in json_str
         
+    def test_metrics_are_immutable(self, sample_metrics):
+        """Test calculated metrics cannot be modified after creation."""
+        with pytest.raises(FrozenInstanceError):
+            sample_metrics.deployment_count = 0
+        
+    def test_config_presets_are_shared(self):
+        """Test preset configs are cached and cannot be modified."""
+        config = MetricsConfig.daily_all()
+        
+        assert MetricsConfig.daily_all() is config
+        with pytest.raises(FrozenInstanceError):
+            config.reporting_period = Period.WEEKLY
+        with pytest.raises(FrozenInstanceError):
+            config.lead_time.period = Period.WEEKLY
+        
+    def test_calculated_metrics_to_json(self, daily_results):
+        """Test calculated metrics (NumPy statistics) serialize to valid JSON."""
+        data = json.loads(daily_results[2].to_json())
+        assert data["context"]["deployment_count"] == 1
+        assert data["lead_time_statistics"]["p50"] == pytest.approx(
+            daily_results[2].lead_time_p50
+        )
+        
+    def test_metrics_result_table(self, daily_results):
+        """Test the columnar view matches the per-period results."""
+        table = MetricsResultTable.from_metrics(daily_results)
+        
+        assert len(table) == 4
+        assert table[2] is daily_results[2]
+        assert table.deployment_count.tolist() == [m.deployment_count for m in daily_results]
+        assert table.deployment_count.sum() == 1
+        # Days without deployments have no lead time
+        assert np.isnan(table.lead_time_for_changes[0])
+        assert table.lead_time_for_changes[2] == pytest.approx(
+            daily_results[2].lead_time_for_changes
+        )
+        assert table.period_start[0] == np.datetime64("2024-01-01T00:00:00")
+        # Tables compare by identity rather than element-wise over their arrays
+        assert table == table
+        assert table != MetricsResultTable.from_metrics(daily_results)
+        
     def test_lead_time_should_include_all_commits_between_deployments(self, calculator):
         """
         Test that lead time calculation includes ALL commits deployed,
@@ -389,20 +540,14 @@ class TestMetricsCalculator:
         Current behavior: Only deployment commit's lead time is calculated
         Expected behavior: All commits since last deployment should be included
         """
-        base_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         
         commits = []
         
         # First deployment with single commit
-        commit1 = Commit(
-            sha="commit1",
-            author_name="Dev",
-            author_email="dev@example.com",
-            authored_date=base_date,
-            committer_name="Dev",
-            committer_email="dev@example.com",
-            committed_date=base_date,
-            message="Initial commit",
+        commit1 = _make_commit(
+            "commit1",
+            BASE_DATE,
+            "Initial commit",
             files_changed=["file1.py"],
             additions=100,
             deletions=0,
@@ -412,38 +557,28 @@ class TestMetricsCalculator:
         deployment1 = Deployment(
             tag_name="v1.0.0",
             name="First release",
-            created_at=base_date + timedelta(hours=1),
-            published_at=base_date + timedelta(hours=1),
+            created_at=BASE_DATE + HOUR,
+            published_at=BASE_DATE + HOUR,
             commit_sha="commit1",
             is_prerelease=False,
         )
         
         # Multiple commits for second deployment
         # These represent work done between v1.0.0 and v1.1.0
-        commit2 = Commit(
-            sha="commit2",
-            author_name="Dev",
-            author_email="dev@example.com",
-            authored_date=base_date + timedelta(days=1),
-            committer_name="Dev",
-            committer_email="dev@example.com",
-            committed_date=base_date + timedelta(days=1),
-            message="Feature A",
+        commit2 = _make_commit(
+            "commit2",
+            BASE_DATE + DAY,
+            "Feature A",
             files_changed=["feature_a.py"],
             additions=50,
             deletions=10,
         )
         commits.append(commit2)
         
-        commit3 = Commit(
-            sha="commit3",
-            author_name="Dev",
-            author_email="dev@example.com",
-            authored_date=base_date + timedelta(days=2),
-            committer_name="Dev",
-            committer_email="dev@example.com",
-            committed_date=base_date + timedelta(days=2),
-            message="Feature B",
+        commit3 = _make_commit(
+            "commit3",
+            BASE_DATE + 2 * DAY,
+            "Feature B",
             files_changed=["feature_b.py"],
             additions=75,
             deletions=5,
@@ -451,15 +586,10 @@ class TestMetricsCalculator:
         commits.append(commit3)
         
         # Deployment commit
-        commit4 = Commit(
-            sha="commit4",
-            author_name="Dev",
-            author_email="dev@example.com",
-            authored_date=base_date + timedelta(days=3),
-            committer_name="Dev",
-            committer_email="dev@example.com",
-            committed_date=base_date + timedelta(days=3),
-            message="Release prep v1.1.0",
+        commit4 = _make_commit(
+            "commit4",
+            BASE_DATE + 3 * DAY,
+            "Release prep v1.1.0",
             files_changed=["version.py"],
             additions=2,
             deletions=2,
@@ -469,22 +599,21 @@ class TestMetricsCalculator:
         deployment2 = Deployment(
             tag_name="v1.1.0",
             name="Second release",
-            created_at=base_date + timedelta(days=3, hours=2),
-            published_at=base_date + timedelta(days=3, hours=2),
+            created_at=BASE_DATE + 3 * DAY + 2 * HOUR,
+            published_at=BASE_DATE + 3 * DAY + 2 * HOUR,
             commit_sha="commit4",
             is_prerelease=False,
         )
         
         # Calculate metrics with daily reporting
-        from dora_metrics.calculators.metrics import MetricsConfig
         config = MetricsConfig.daily_all()
         
         results = calculator.calculate(
             commits,
             [],
             [deployment1, deployment2],
-            base_date,
-            base_date + timedelta(days=4),
+            BASE_DATE,
+            BASE_DATE + 4 * DAY,
             config
         )
         
@@ -502,37 +631,36 @@ class TestMetricsCalculator:
         # Median of [2, 26, 50] = 26 hours
         
         # This test will FAIL with current implementation
-        assert day3_metrics.lead_time_for_changes == 26.0, \
-            f"Expected median lead time of 26h for all commits, got {day3_metrics.lead_time_for_changes}h"
+        assert day3_metrics.lead_time_for_changes == pytest.approx(26.0), (
+            "Expected median lead time of 26h for all commits, "
+            f"got {day3_metrics.lead_time_for_changes}h"
+        )
         
         # Also check that we counted all commits
-        assert day3_metrics.lead_time_data_points == 3, \
-            f"Expected 3 data points (all commits since v1.0.0), got {day3_metrics.lead_time_data_points}"
+        assert day3_metrics.lead_time_data_points == 3, (
+            "Expected 3 data points (all commits since v1.0.0), "
+            f"got {day3_metrics.lead_time_data_points}"
+        )
     
     def test_lead_time_percentiles(self, calculator):
         """
         Test that lead time calculation includes percentile statistics.
         """
-        base_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         
         # Create commits with varying ages
         commits = []
         
         # Create commits at different times to create varying lead times
-        # When deployed together, they'll have lead times of: 1, 2, 3, 4, 5, 10, 20, 30, 40, 100 hours
+        # When deployed together, they'll have lead times of:
+        # 1, 2, 3, 4, 5, 10, 20, 30, 40, 100 hours
         hours_before_deploy = [1, 2, 3, 4, 5, 10, 20, 30, 40, 100]
-        deploy_time = base_date + timedelta(days=5)  # Deploy on day 5
+        deploy_time = BASE_DATE + 5 * DAY  # Deploy on day 5
         
         for i, hours in enumerate(hours_before_deploy):
-            commit = Commit(
-                sha=f"commit_{i}",
-                author_name="Dev",
-                author_email="dev@example.com",
-                authored_date=deploy_time - timedelta(hours=hours),
-                committer_name="Dev",
-                committer_email="dev@example.com",
-                committed_date=deploy_time - timedelta(hours=hours),
-                message=f"Commit {i} - {hours}h before deploy",
+            commit = _make_commit(
+                f"commit_{i}",
+                deploy_time - hours * HOUR,
+                f"Commit {i} - {hours}h before deploy",
                 files_changed=[f"file{i}.py"],
                 additions=10,
                 deletions=5,
@@ -555,8 +683,8 @@ class TestMetricsCalculator:
             commits,
             [],
             [deployment],
-            base_date,
-            base_date + timedelta(days=6),
+            BASE_DATE,
+            BASE_DATE + 6 * DAY,
             config
         )
         
@@ -567,72 +695,41 @@ class TestMetricsCalculator:
         assert day_metrics.lead_time_data_points == 10
         
         # Check the median (p50)
-        assert day_metrics.lead_time_for_changes == 7.5  # Median of [1,2,3,4,5,10,20,30,40,100]
-        assert day_metrics.lead_time_p50 == 7.5
+        # Median of [1,2,3,4,5,10,20,30,40,100]
+        assert day_metrics.lead_time_for_changes == pytest.approx(7.5)
+        assert day_metrics.lead_time_p50 == pytest.approx(7.5)
         
         # Check percentiles (using approx for floating point)
-        assert abs(day_metrics.lead_time_p90 - 46.0) < 0.1  # 90th percentile
-        assert abs(day_metrics.lead_time_p95 - 73.0) < 0.1  # 95th percentile
+        assert day_metrics.lead_time_p90 == pytest.approx(46.0, abs=0.1)  # 90th percentile
+        assert day_metrics.lead_time_p95 == pytest.approx(73.0, abs=0.1)  # 95th percentile
         
         # Check mean is affected by the outlier
-        assert day_metrics.lead_time_mean == 21.5  # Mean of all values
+        assert day_metrics.lead_time_mean == pytest.approx(21.5)  # Mean of all values
         
         # Check standard deviation is high due to outlier
         assert day_metrics.lead_time_std_dev > 28  # High variation
         
         # Check min/max
-        assert day_metrics.lead_time_min == 1.0
-        assert day_metrics.lead_time_max == 100.0
+        assert day_metrics.lead_time_min == pytest.approx(1.0)
+        assert day_metrics.lead_time_max == pytest.approx(100.0)
     
     def test_manual_deployment_failed_as_boolean(self, calculator):
         """Test that manual_deployment_failed works with boolean values (as CSV import produces)."""
-        base_date = datetime(2024, 1, 1, tzinfo=timezone.utc)
         
-        # Create commits with manual deployments
+        # Create commits with manual deployments as (day offset, tag, failed)
         # Note: CSV import converts string "true"/"false" to boolean True/False
+        deploy_specs = [(0, "v1.0", False), (1, "v1.1", True), (2, "v1.2", False)]
         commits = [
-            Commit(
-                sha="commit1",
-                author_name="Dev",
-                author_email="dev@example.com",
-                authored_date=base_date,
-                committer_name="Dev",
-                committer_email="dev@example.com",
-                committed_date=base_date,
-                message="Deploy v1.0",
-                is_manual_deployment=True,
-                manual_deployment_timestamp=base_date,
-                manual_deployment_failed=False,  # Boolean False (as CSV import produces)
-                deployment_tag="v1.0"
-            ),
-            Commit(
-                sha="commit2",
-                author_name="Dev",
-                author_email="dev@example.com",
-                authored_date=base_date.replace(day=2),
-                committer_name="Dev",
-                committer_email="dev@example.com",
-                committed_date=base_date.replace(day=2),
-                message="Deploy v1.1 - hotfix",
+            _make_commit(
+                f"commit{i}",
+                BASE_DATE + day * DAY,
+                f"Deploy {tag}",
                 is_manual_deployment=True,
-                manual_deployment_timestamp=base_date.replace(day=2),
-                manual_deployment_failed=True,  # Boolean True (as CSV import produces)
-                deployment_tag="v1.1"
-            ),
-            Commit(
-                sha="commit3",
-                author_name="Dev",
-                author_email="dev@example.com",
-                authored_date=base_date.replace(day=3),
-                committer_name="Dev",
-                committer_email="dev@example.com",
-                committed_date=base_date.replace(day=3),
-                message="Deploy v1.2",
-                is_manual_deployment=True,
-                manual_deployment_timestamp=base_date.replace(day=3),
-                manual_deployment_failed=False,  # Boolean False (as CSV import produces)
-                deployment_tag="v1.2"
-            ),
+                manual_deployment_timestamp=BASE_DATE + day * DAY,
+                manual_deployment_failed=failed,
+                deployment_tag=tag,
+            )
+            for i, (day, tag, failed) in enumerate(deploy_specs, 1)
         ]
         
         # Calculate metrics
@@ -641,8 +738,8 @@ class TestMetricsCalculator:
             commits=commits,
             pull_requests=[],
             deployments=[],
-            start_date=base_date,
-            end_date=base_date.replace(month=2),
+            start_date=BASE_DATE,
+            end_date=BASE_DATE.replace(month=2),
             config=config
         )
         
@@ -61,6 +61,10 @@ class TestPRHealthAnalyzer:
         
         report = analyzer.analyze(prs)
         assert report.total_open_prs == 0
+        assert report.small_count == 0
+        assert report.median_age_days is None
+        assert report.oldest_pr_age_days is None
+        assert report.recommendations == []
     
     def test_active_pr_categorization(self, analyzer, base_date):
         """Test PRs are correctly categorized as active."""
@@ -456,6 +460,77 @@ class TestPRHealthAnalyzer:
         
         assert any("bob has 5 stale/abandoned PRs" in rec for rec in report.recommendations)
     
+    def test_stale_and_abandoned_prs_are_ordered(self, analyzer, base_date):
+        """Test stale PRs are ordered by inactivity and abandoned PRs by age."""
+        prs = [
+            PullRequest(
+                number=number,
+                title=f"PR {number}",
+                state=PRState.OPEN,
+                created_at=base_date - timedelta(days=created_days_ago),
+                updated_at=base_date - timedelta(days=updated_days_ago),
+                closed_at=None,
+                merged_at=None,
+                merge_commit_sha=None,
+                author="dev",
+                labels=[],
+                commits=[],
+                additions=10,
+                deletions=0,
+            )
+            for number, created_days_ago, updated_days_ago in [
+                (1, 0, -5),   # stale, 9 days inactive
+                (2, 60, 40),  # abandoned, 74 days old
+                (3, 10, -1),  # stale, 13 days inactive
+                (4, 90, 20),  # abandoned, 104 days old
+            ]
+        ]
+        
+        report = analyzer.analyze(prs)
+        
+        assert [pr.pr_number for pr in report.stale_prs] == [3, 1]
+        assert [pr.pr_number for pr in report.abandoned_prs] == [4, 2]
+    
+    def test_report_to_dict(self, analyzer, base_date):
+        """Test report serialization to a JSON-ready dictionary."""
+        pr = PullRequest(
+            number=7,
+            title="Stale PR",
+            state=PRState.OPEN,
+            created_at=base_date,
+            updated_at=base_date + timedelta(days=5),
+            closed_at=None,
+            merged_at=None,
+            merge_commit_sha=None,
+            author="dev",
+            labels=[],
+            commits=["c1", "c2"],
+            additions=250,
+            deletions=100,
+        )
+        
+        report = analyzer.analyze([pr])
+        data = report.to_dict()
+        
+        assert data["total_open_prs"] == 1
+        assert data["stale_count"] == 1
+        assert data["medium_count"] == 1
+        assert data["stale_prs"] == [{
+            "pr_number": 7,
+            "title": "Stale PR",
+            "author": "dev",
+            "status": "stale",
+            "size": "medium",
+            "age_days": 14,
+            "days_since_activity": 9,
+            "created_at": "2024-01-01T00:00:00+00:00",
+            "updated_at": "2024-01-06T00:00:00+00:00",
+            "additions": 250,
+            "deletions": 100,
+            "commits_count": 2,
+        }]
+        assert report.to_dict() is data
+    
     def test_summary_output(self, analyzer, base_date):
         """Test summary output format."""
         prs = [
@@ -518,6 +593,7 @@ class TestPRHealthAnalyzer:
         assert "Abandoned: 1 (33%)" in summary
         assert "⚠️  1 PRs need attention" in summary
         assert "❌ 1 PRs should be closed" in summary
+        assert report.get_summary() is summary
     
     def test_detailed_report_output(self, analyzer, base_date):
         """Test detailed report output format."""
@@ -548,4 +624,5 @@ class TestPRHealthAnalyzer:
         assert "AGE STATISTICS" in detailed
         assert "STALE PRS (need attention)" in detailed
         assert "PR #123: Feature: Add new dashboard widgets with real-time ..." in detailed
+        assert report.get_detailed_report() is detailed
         assert "Author: alice, Size: medium, Inactive: 9 days" in detailed
\ No newline at end of file
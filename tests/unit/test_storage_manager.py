@@ -1,29 +1,64 @@
 """Unit tests for storage manager."""
 
+import hashlib
+import os
 import shutil
 import tempfile
+from datetime import datetime
 from pathlib import Path
 
+import orjson
 import pytest
 
 from dora_metrics.storage import StorageManager
 
+# Keep temporary directories on tmpfs where available
+TEMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+JSON_PAYLOAD = {"key": "value", "number": 42, "list": [1, 2, 3], "nested": {"a": 1, "b": 2}}
+UNICODE_CONTENT = "Hello 世界 🌍"
+LARGE_JSON_PAYLOAD = {
+    "commits": [
+        {"sha": f"{i:040x}", "author": f"dev{i % 17}", "files": [f"src/module_{i % 50}.py"]}
+        for i in range(5000)
+    ]
+}
+
+
+def json_digest(data) -> bytes:
+    """Hash a JSON document's canonical encoding, for comparing large payloads."""
+    return hashlib.blake2b(orjson.dumps(data, option=orjson.OPT_SORT_KEYS)).digest()
+
+
+@pytest.fixture(scope="module")
+def temp_root():
+    """Create one directory holding every test's temporary directory."""
+    temp_root = tempfile.mkdtemp(dir=TEMP_ROOT)
+    yield temp_root
+    shutil.rmtree(temp_root)
+
 
 @pytest.mark.unit
-class TestLocalStorageBackend:
-    """Test local filesystem storage backend."""
+class TestStorageBackends:
+    """Test the local filesystem and in-memory storage backends."""
 
     @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+    def temp_dir(self, temp_root):
+        """Create a temporary directory for testing (removed with the module's root)."""
+        return tempfile.mkdtemp(dir=temp_root)
 
     @pytest.fixture
-    def storage(self, temp_dir):
-        """Create a storage manager instance."""
-        return StorageManager(storage_type="local", base_path=temp_dir)
+    def local_storage(self, temp_dir):
+        """Create a storage manager on the local filesystem."""
+        with StorageManager(storage_type="local", base_path=temp_dir) as storage:
+            yield storage
+
+    @pytest.fixture(params=["local", "memory"])
+    def storage(self, request):
+        """Create a storage manager instance for each backend."""
+        if request.param == "memory":
+            return StorageManager(storage_type="memory")
+        return request.getfixturevalue("local_storage")
 
     def test_init_creates_base_directory(self, temp_dir):
         """Test that initialization creates the base directory."""
@@ -49,6 +84,61 @@ class TestLocalStorageBackend:
         storage.write(path, content)
         assert storage.read(path) == content
 
+    def test_write_to_created_ancestor_directory(self, local_storage):
+        """Test writes into an ancestor of an earlier write's directory."""
+        local_storage.write("a/b/c/deep.txt", "deep")
+        local_storage.write("a/b/shallow.txt", "shallow")
+
+        assert local_storage.list("a") == ["a/b/c/deep.txt", "a/b/shallow.txt"]
+
+    def test_write_respects_umask(self, local_storage, temp_dir):
+        """Test new files get the default mode filtered by the process umask."""
+        old_umask = os.umask(0o002)
+        try:
+            local_storage.write("shared.txt", "shared")
+        finally:
+            os.umask(old_umask)
+
+        assert (Path(temp_dir) / "shared.txt").stat().st_mode & 0o777 == 0o664
+
+    def test_write_after_directory_removed(self, local_storage, temp_dir):
+        """Test writes recreate a cached directory that was removed externally."""
+        local_storage.write("subdir/first.txt", "first")
+        shutil.rmtree(Path(temp_dir) / "subdir")
+
+        local_storage.write("subdir/second.txt", "second")
+        assert local_storage.read("subdir/second.txt") == "second"
+
+    def test_write_many(self, storage):
+        """Test writing a batch of files."""
+        items = {f"batch/file_{i}.txt": f"content_{i}" for i in range(20)}
+
+        storage.write_many(items)
+
+        assert storage.list("batch") == sorted(items)
+        for path, content in items.items():
+            assert storage.read(path) == content
+
+    def test_write_many_pairs(self, storage):
+        """Test writing a batch given as (path, content) pairs."""
+        storage.write_many([("a/one.txt", "1"), ("b/two.txt", "2"), ("a/three.txt", "3")])
+
+        assert storage.list("") == ["a/one.txt", "a/three.txt", "b/two.txt"]
+        assert storage.read("b/two.txt") == "2"
+
+    def test_read_empty_file(self, storage):
+        """Test reading back an empty file."""
+        storage.write("empty.txt", "")
+        assert storage.read("empty.txt") == ""
+
+    def test_read_handles_short_reads(self, local_storage, monkeypatch):
+        """Test reads keep going when the OS returns fewer bytes than requested."""
+        local_storage.write("short.txt", "partial reads add up")
+        real_read = os.read
+        monkeypatch.setattr(os, "read", lambda fd, size: real_read(fd, min(size, 3)))
+
+        assert local_storage.read("short.txt") == "partial reads add up"
+
     def test_read_nonexistent_file(self, storage):
         """Test reading a non-existent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError, match="File not found: nonexistent.txt"):
@@ -75,6 +165,39 @@ class TestLocalStorageBackend:
         """Test deleting non-existent file doesn't raise error."""
         storage.delete("nonexistent.txt")  # Should not raise
 
+    def test_write_many_repeated_path_keeps_last(self, storage):
+        """Test a path repeated in one batch ends up with its last content."""
+        items = [(f"dup/file_{i % 3}.txt", f"content_{i}") for i in range(12)]
+
+        storage.write_many(items, max_workers=4)
+
+        assert storage.list("dup") == ["dup/file_0.txt", "dup/file_1.txt", "dup/file_2.txt"]
+        assert storage.read("dup/file_0.txt") == "content_9"
+        assert storage.read("dup/file_2.txt") == "content_11"
+
+    def test_close_shuts_down_pool(self, temp_dir):
+        """Test closing the manager stops its batch threads and allows reuse."""
+        with StorageManager(storage_type="local", base_path=temp_dir) as storage:
+            storage.write_many({f"f{i}.txt": "x" for i in range(4)}, max_workers=2)
+            pool = storage._pool
+            assert pool is not None
+
+        assert storage._pool is None
+        with pytest.raises(RuntimeError):
+            pool.submit(print)
+
+        storage.write_many({"again.txt": "y", "more.txt": "z"}, max_workers=2)
+        assert storage.read("again.txt") == "y"
+        storage.close()
+
+    def test_delete_many(self, storage):
+        """Test deleting a batch of files, skipping missing ones."""
+        storage.write_many({"a.txt": "a", "dir/b.txt": "b", "keep.txt": "c"})
+
+        storage.delete_many(["a.txt", "dir/b.txt", "missing.txt"], max_workers=2)
+
+        assert storage.list("") == ["keep.txt"]
+
     def test_list_files_in_directory(self, storage):
         """Test listing files in a directory."""
         # Create some test files
@@ -97,6 +220,35 @@ class TestLocalStorageBackend:
         files = storage.list("test_")
         assert sorted(files) == ["test_1.json", "test_2.json"]
 
+    def test_list_tracks_writes_and_deletes(self, local_storage, temp_dir):
+        """Test listings stay current after the first list call."""
+        (Path(temp_dir) / "existing.txt").write_text("on disk")
+        assert local_storage.list("") == ["existing.txt"]
+
+        local_storage.write("dir/new.txt", "new")
+        local_storage.write("dir_note.txt", "note")
+        local_storage.delete("existing.txt")
+
+        assert local_storage.list("") == ["dir/new.txt", "dir_note.txt"]
+        assert local_storage.list("dir") == ["dir/new.txt"]
+        assert local_storage.list("dir_") == ["dir_note.txt"]
+
+    def test_list_sees_changes_from_other_managers(self, local_storage, temp_dir):
+        """Test cached directory listings pick up files written elsewhere."""
+        local_storage.write("shared/first.txt", "first")
+        # Age the directories so their listings are cached
+        for directory in (temp_dir, os.path.join(temp_dir, "shared")):
+            os.utime(directory, (1_000_000_000, 1_000_000_000))
+        assert local_storage.list("shared") == ["shared/first.txt"]
+
+        other = StorageManager(storage_type="local", base_path=temp_dir)
+        other.write("shared/second.txt", "second")
+        (Path(temp_dir) / "shared" / "third.txt").write_text("third")
+
+        assert local_storage.list("shared") == [
+            "shared/first.txt", "shared/second.txt", "shared/third.txt"
+        ]
+
     def test_list_empty_directory(self, storage):
         """Test listing an empty or non-existent directory."""
         files = storage.list("empty_dir")
@@ -104,7 +256,7 @@ class TestLocalStorageBackend:
 
     def test_json_operations(self, storage):
         """Test JSON read/write operations."""
-        data = {"key": "value", "number": 42, "list": [1, 2, 3], "nested": {"a": 1, "b": 2}}
+        data = JSON_PAYLOAD
         path = "test.json"
 
         storage.write_json(path, data)
@@ -112,10 +264,97 @@ class TestLocalStorageBackend:
 
         assert loaded_data == data
 
+    def test_write_json_value_formats(self, storage):
+        """Test datetimes are written as str() does and NaN is written as null."""
+        storage.write_json("values.json", {"at": datetime(2024, 1, 1), "ratio": float("nan")})
+
+        assert storage.read_json("values.json") == {"at": "2024-01-01 00:00:00", "ratio": None}
+
+    def test_read_json_repeated(self, local_storage, temp_dir):
+        """Test repeated JSON reads return fresh objects and see external changes."""
+        local_storage.write_json("cached.json", {"items": []})
+
+        first = local_storage.read_json("cached.json")
+        first["items"].append(1)
+        assert local_storage.read_json("cached.json") == {"items": []}
+
+        (Path(temp_dir) / "cached.json").write_text('{"items": [1, 2]}')
+        assert local_storage.read_json("cached.json") == {"items": [1, 2]}
+
+    def test_read_json_sees_same_size_rewrite(self, local_storage, temp_dir):
+        """Test a rewrite that keeps the size and mtime of a recent file is not missed."""
+        path = Path(temp_dir) / "recent.json"
+        path.write_text('{"version": 1}')
+        st = os.stat(path)
+        assert local_storage.read_json("recent.json") == {"version": 1}
+
+        # Same size, and an mtime the filesystem could not tell apart
+        path.write_text('{"version": 2}')
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert local_storage.read_json("recent.json") == {"version": 2}
+
+    def test_append_json_array(self, storage):
+        """Test appending items to a stored JSON array."""
+        storage.append_json_array("items.json", {"id": 1})
+        storage.write_json("items.json", storage.read_json("items.json") + [{"id": 2}])
+        storage.append_json_array("items.json", {"id": 3, "at": datetime(2024, 1, 1)})
+
+        assert storage.read_json("items.json") == [
+            {"id": 1},
+            {"id": 2},
+            {"id": 3, "at": "2024-01-01 00:00:00"},
+        ]
+
+    def test_append_json_array_requires_array(self, storage):
+        """Test appending to a JSON object raises ValueError."""
+        storage.write_json("object.json", {"items": []})
+
+        with pytest.raises(ValueError, match="does not hold an array"):
+            storage.append_json_array("object.json", {"id": 1})
+
+    def test_append_json_array_key(self, storage):
+        """Test appending items to an array stored under a key of a JSON object."""
+        storage.append_json_array("data.json", {"sha": "abc123"}, key="commits")
+        storage.append_json_array("data.json", {"sha": "def456"}, key="commits")
+        storage.append_json_array("data.json", {"number": 1}, key="prs")
+
+        assert storage.read_json("data.json") == {
+            "commits": [{"sha": "abc123"}, {"sha": "def456"}],
+            "prs": [{"number": 1}],
+        }
+
+        storage.write_json("data.json", {"commits": {}})
+        with pytest.raises(ValueError, match="does not hold an array at 'commits'"):
+            storage.append_json_array("data.json", {"sha": "abc123"}, key="commits")
+
+    def test_jsonl_operations(self, storage):
+        """Test JSON Lines append, write and iteration."""
+        storage.append_jsonl("events/log.jsonl", {"id": 1})
+        storage.append_jsonl("events/log.jsonl", {"id": 2, "at": datetime(2024, 1, 1)})
+
+        assert list(storage.iter_jsonl("events/log.jsonl")) == [
+            {"id": 1},
+            {"id": 2, "at": "2024-01-01 00:00:00"},
+        ]
+
+        storage.write_json("items.json", [{"id": 3}, {"id": 4}])
+        storage.write_jsonl("items.jsonl", storage.read_json("items.json"))
+        assert storage.read("items.jsonl") == '{"id":3}\n{"id":4}\n'
+
+        with pytest.raises(FileNotFoundError):
+            storage.iter_jsonl("missing.jsonl")
+
+    def test_json_large_payload(self, storage):
+        """Test a large JSON round trip by comparing content hashes."""
+        path = "large.json"
+
+        storage.write_json(path, LARGE_JSON_PAYLOAD)
+
+        assert json_digest(storage.read_json(path)) == json_digest(LARGE_JSON_PAYLOAD)
+
     def test_json_with_datetime(self, storage):
         """Test JSON serialization with datetime objects."""
-        from datetime import datetime
-
         data = {"timestamp": datetime(2024, 1, 1, 12, 0, 0), "name": "test"}
         path = "test_datetime.json"
 
@@ -125,14 +364,35 @@ class TestLocalStorageBackend:
         # Check that datetime was serialized as string
         assert "2024-01-01" in content
 
+    def test_json_with_custom_indent(self, storage):
+        """Test JSON written with a non-default indent reads back the same."""
+        data = {"key": "value", "list": [1, 2, 3]}
+        path = "indented.json"
+
+        storage.write_json(path, data, indent=4)
+
+        assert '\n    "key": "value"' in storage.read(path)
+        assert storage.read_json(path) == data
+
     def test_unicode_content(self, storage):
         """Test handling Unicode content."""
-        content = "Hello 世界 🌍"
+        content = UNICODE_CONTENT
         path = "unicode.txt"
 
         storage.write(path, content)
         assert storage.read(path) == content
 
+    def test_write_bytes_content(self, storage):
+        """Test bytes content is stored as UTF-8 without re-encoding."""
+        storage.write("bytes.txt", "Grüße\n".encode("utf-8"))
+        assert storage.read("bytes.txt") == "Grüße\n"
+
+    def test_read_normalizes_line_endings(self, local_storage, temp_dir):
+        """Test reads translate Windows line endings like text-mode files."""
+        (Path(temp_dir) / "crlf.csv").write_bytes(b"id,name\r\n1,test\r\n")
+
+        assert local_storage.read("crlf.csv") == "id,name\n1,test\n"
+
     def test_storage_type_validation(self):
         """Test that invalid storage type raises ValueError."""
         with pytest.raises(ValueError, match="Unknown storage type: invalid"):